@@ -116,7 +116,7 @@ class AIClient:
                     global_settings_file = content_dir / "StoryboardTo3D" / "Settings" / "global_settings.json"
 
                     if global_settings_file.exists():
-                        with open(global_settings_file, 'r') as f:
+                        with open(global_settings_file, 'r', encoding='utf-8') as f:
                             global_settings = json.load(f)
 
                         ai_settings = global_settings.get('ai_settings', {})
@@ -191,7 +191,7 @@ class AIClient:
                     global_settings_file = content_dir / "StoryboardTo3D" / "Settings" / "global_settings.json"
 
                     if global_settings_file.exists():
-                        with open(global_settings_file, 'r') as f:
+                        with open(global_settings_file, 'r', encoding='utf-8') as f:
                             global_settings = json.load(f)
 
                         # Check ai_settings section (NEW settings dialog)
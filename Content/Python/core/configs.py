@@ -0,0 +1,59 @@
+# Copyright (c) 2025 Tyler Varacchi. All Rights Reserved.
+# This code is proprietary. Unauthorized copying or use is prohibited.
+
+"""
+Scene Config Records
+
+Fixed-layout records for the spawn configs SceneBuilder prepares before
+creating spawnables in a Level Sequence.
+"""
+
+import unreal
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass(slots=True)
+class ActorConfig:
+    """
+    Spawn config for one character or prop.
+
+    Attributes:
+        type: 'spawnable', or 'spawnable_placeholder' for missing assets.
+        name: Display name of the spawnable.
+        position: Initial world position.
+        rotation: Initial rotation; None means unrotated.
+        asset_path: Content path of the asset, empty for placeholders.
+        is_placeholder: Whether a placeholder cube stands in for the asset.
+    """
+    type: str
+    name: str
+    position: unreal.Vector
+    rotation: Optional[unreal.Rotator] = None
+    asset_path: str = ''
+    is_placeholder: bool = False
+
+
+@dataclass(slots=True)
+class SpawnSpec:
+    """
+    Resolved camera or light config, ready to apply on the game thread.
+
+    Attributes:
+        actor_class: Actor class to add as a spawnable.
+        name: Config name, used in error messages.
+        display_name: Binding display name, or None to keep the default.
+        position: Initial world position.
+        rotation: Initial rotation.
+        focal_length: Camera focal length in mm.
+        intensity: Light intensity.
+        color: Light color; only read for lights.
+    """
+    actor_class: Any
+    name: str
+    display_name: Optional[str]
+    position: unreal.Vector
+    rotation: unreal.Rotator
+    focal_length: float = 50.0
+    intensity: float = 5000.0
+    color: Optional[unreal.LinearColor] = None
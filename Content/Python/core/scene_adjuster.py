@@ -4,11 +4,73 @@
 Automatically applies AI positioning recommendations to Unreal scene
 """
 import unreal
-from typing import Dict, List, Any, Optional
+import math
+import traceback
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Tuple
+
+from core.debug_logger import logger, LogLevel
+
+# Optional: JIT-compile the look-at kernel when numba is installed
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# SIMPLIFIED FOR T-POSE PROOF-OF-CONCEPT:
+# Characters at Z=0 (ground level), height ~170 units
+# For medium shot, look at chest/head level (~85-100 units up)
+# Look-at targets get this offset to aim at mid-body height for better framing
+LOOK_AT_HEAD_OFFSET = 85.0  # Chest level for medium shot (half character height)
+
+_RAD_TO_DEG = 180.0 / math.pi
+
+# Log section banners, prebuilt once
+_BANNER = "=" * 70
+_BANNER_NL = _BANNER + "\n"
+_APPLYING_RECOMMENDATIONS_HEADER = f"\n{_BANNER}\nAPPLYING AI RECOMMENDATIONS\n{_BANNER}"
+_APPLYING_CAMERA_HEADER = f"{_BANNER}\nAPPLYING CAMERA ADJUSTMENTS\n{_BANNER_NL}"
+
+
+def _look_at_angles(dx: float, dy: float, dz: float) -> Tuple[float, float]:
+    """
+    Get (pitch, yaw) in degrees for a camera looking along direction (dx, dy, dz)
+
+    Euler angles come straight from the direction vector (no quaternion/matrix
+    round trip). Yaw is the angle in the XY plane (rotation around Z-axis); Unreal
+    cameras face +X at yaw 0, so no offset is needed. Unreal pitch is negative
+    when looking down, which atan2 gives directly: negative dz (target below) ->
+    negative angle.
+    """
+    horizontal_dist = math.hypot(dx, dy)
+
+    # Looking straight up/down: yaw is undefined (gimbal lock), keep it at 0
+    if horizontal_dist < 1e-6:
+        return (math.copysign(90.0, dz) if dz else 0.0), 0.0
+
+    pitch = math.atan2(dz, horizontal_dist) * _RAD_TO_DEG
+    yaw = math.atan2(dy, dx) * _RAD_TO_DEG
+    return pitch, yaw
+
+
+if NUMBA_AVAILABLE:
+    _look_at_angles = njit(cache=True)(_look_at_angles)
+
 
 class SceneAdjuster:
     """Applies AI positioning recommendations to actors and cameras"""
 
+    # Position clamp bounds as ((min_x, min_y, min_z), (max_x, max_y, max_z))
+    # Camera: reasonable positioning around scene origin, never underground, max 10m height
+    _CAMERA_BOUNDS = ((-2000.0, -2000.0, 50.0), (2000.0, 2000.0, 1000.0))
+    # Actors (characters, props): wide range for placement, ground level -10cm to 3m height
+    _ACTOR_BOUNDS = ((-5000.0, -5000.0, -10.0), (5000.0, 5000.0, 300.0))
+
+    # Characters the hero camera frames, and binding name tokens that are never characters
+    _CHAR_NAMES = ('Oat', 'Sprout')
+    _SKIP_TOKENS = ('camera', 'light')
+
     def __init__(self, sequence_asset=None, use_absolute_positioning=False):
         """
         Initialize SceneAdjuster
@@ -18,11 +80,87 @@ class SceneAdjuster:
             use_absolute_positioning: If True, treat position values as absolute coordinates.
                                      If False (default), treat as relative adjustments.
         """
-        self.editor_actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
-        self.level_editor_subsystem = unreal.get_editor_subsystem(unreal.LevelEditorSubsystem)
-        self.sequence_asset = sequence_asset
+        # Editor subsystems are acquired on first use (sequence-only workflows never need them)
+        self._editor_actor_subsystem = None
+        self._level_editor_subsystem = None
+        self.sequence_asset = sequence_asset  # Also resets the binding caches
         self.use_absolute_positioning = use_absolute_positioning
 
+        # Per-step diagnostics are only built and logged when the debug logger is at DEBUG level
+        self._verbose = logger.get_level() <= LogLevel.DEBUG
+
+        # Reused look-at rotation adjustment (apply_adjustment_to_sequence only reads it)
+        self._rot_scratch = {
+            'actor': None,
+            'type': 'rotate',
+            'scope': 'sequence',
+            'rotation': None,
+            'reason': 'Auto-calculated look-at rotation'
+        }
+
+        # True while apply_all_adjustments batches keyframe edits (sequence opened/refreshed once)
+        self._batching = False
+
+    @property
+    def editor_actor_subsystem(self):
+        """EditorActorSubsystem, acquired on first access"""
+        if self._editor_actor_subsystem is None:
+            self._editor_actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+        return self._editor_actor_subsystem
+
+    @property
+    def level_editor_subsystem(self):
+        """LevelEditorSubsystem, acquired on first access"""
+        if self._level_editor_subsystem is None:
+            self._level_editor_subsystem = unreal.get_editor_subsystem(unreal.LevelEditorSubsystem)
+        return self._level_editor_subsystem
+
+    @property
+    def sequence_asset(self):
+        """Level sequence adjustments are applied to"""
+        return self._sequence_asset
+
+    @sequence_asset.setter
+    def sequence_asset(self, sequence_asset):
+        self._sequence_asset = sequence_asset
+        self.invalidate_binding_cache()
+
+    def invalidate_binding_cache(self):
+        """Drop cached binding lookups (call after bindings are added/removed or the sequence reloads)"""
+        # (display_name, lowercase_name, binding) per sequence binding, built on first scan
+        self._binding_index = None
+        # Same tuples minus camera/light bindings
+        self._character_bindings = None
+        # camera_pattern -> camera binding name found by find_camera_in_sequence
+        self._camera_name_cache: Dict[str, str] = {}
+
+    def _get_binding_index(self) -> List[Tuple[str, str, Any]]:
+        """Get cached binding names so each display name is converted from Text only once"""
+        if self._binding_index is None:
+            index = []
+            for binding in self.sequence_asset.get_bindings():
+                binding_name = str(binding.get_display_name())  # Convert Text to string
+                index.append((binding_name, binding_name.lower(), binding))
+            self._binding_index = index
+        return self._binding_index
+
+    def _get_character_bindings(self) -> List[Tuple[str, str, Any]]:
+        """Get cached binding index entries that are not cameras or lights"""
+        if self._character_bindings is None:
+            self._character_bindings = [
+                entry for entry in self._get_binding_index()
+                if not any(tok in entry[1] for tok in self._SKIP_TOKENS)
+            ]
+        return self._character_bindings
+
+    @staticmethod
+    def _get_frame_zero_value(channel, default: float = 0.0) -> float:
+        """Get a channel's keyframe value at frame 0, or default if it has no key there"""
+        for key in channel.get_keys():
+            if key.get_time().frame_number.value == 0:
+                return key.get_value()
+        return default
+
     def find_actor_by_name(self, actor_name: str) -> Optional[unreal.Actor]:
         """Find an actor in the current level by name"""
         all_actors = self.editor_actor_subsystem.get_all_level_actors()
@@ -53,12 +191,10 @@ class SceneAdjuster:
             return None
 
         try:
-            bindings = self.sequence_asset.get_bindings()
+            actor_lname = actor_name.lower()
 
-            for binding in bindings:
-                binding_name = str(binding.get_display_name())  # Convert Text to string
-
-                if actor_name.lower() in binding_name.lower():
+            for binding_name, binding_lname, binding in self._get_binding_index():
+                if actor_lname in binding_lname:
                     unreal.log(f"Found '{binding_name}' in sequence bindings")
 
                     # For spawnables, get the object template
@@ -68,18 +204,8 @@ class SceneAdjuster:
                         # Return None to signal caller to use sequence keyframe API
                         return None
 
-                    # For possessables, try to find the bound actor in the level
-                    # Get the binding ID and resolve it
-                    binding_id = binding.get_id()
-
-                    # Try to find actor with matching possessable GUID
-                    all_actors = self.editor_actor_subsystem.get_all_level_actors()
-                    for actor in all_actors:
-                        # Check if this actor matches the binding
-                        # (This is tricky - possessables are bound by GUID)
-                        # For now, return None and we'll handle this differently
-                        pass
-
+                    # For possessables the bound actor is resolved by GUID, which is not
+                    # implemented yet - return None and let the caller use the keyframe API
                     unreal.log_warning(f"Could not resolve binding to actor (may be spawnable)")
                     return None
 
@@ -92,30 +218,25 @@ class SceneAdjuster:
 
     def list_all_actors(self):
         """List all actors in level and sequence"""
-        unreal.log("\n" + "="*70)
-        unreal.log("ACTORS IN SCENE")
-        unreal.log("="*70)
+        lines = ["\n" + _BANNER, "ACTORS IN SCENE", _BANNER]
 
         # Level actors
-        unreal.log("\nLevel Actors:")
+        lines.append("\nLevel Actors:")
         all_actors = self.editor_actor_subsystem.get_all_level_actors()
         for actor in all_actors:
-            label = actor.get_actor_label()
-            actor_type = actor.get_class().get_name()
-            unreal.log(f"- {label} ({actor_type})")
+            lines.append(f"- {actor.get_actor_label()} ({actor.get_class().get_name()})")
 
         # Sequence actors
         if self.sequence_asset:
-            unreal.log("\nSequence Bindings:")
+            lines.append("\nSequence Bindings:")
             try:
-                bindings = self.sequence_asset.get_bindings()
-                for binding in bindings:
-                    binding_name = str(binding.get_display_name())
-                    unreal.log(f"- {binding_name}")
+                for binding_name, _, _ in self._get_binding_index():
+                    lines.append(f"- {binding_name}")
             except Exception as e:
                 unreal.log_warning(f"Could not list sequence bindings: {e}")
 
-        unreal.log("="*70 + "\n")
+        lines.append(_BANNER_NL)
+        unreal.log("\n".join(lines))
 
     def apply_position(self, actor: unreal.Actor, position: Dict[str, float]) -> bool:
         """Apply position to actor (using named parameters to avoid memory bug)"""
@@ -179,7 +300,11 @@ class SceneAdjuster:
             return False
 
     def apply_adjustment(self, adjustment: Dict[str, Any]) -> bool:
-        """Apply a single adjustment from AI recommendation"""
+        """Apply a single adjustment from AI recommendation
+
+        The optional 'scope' key ('auto' by default) lets callers that already know
+        the target is a sequence binding pass 'sequence' to skip the level actor scan.
+        """
         actor_name = adjustment.get('actor')
         adj_type = adjustment.get('type')
 
@@ -187,6 +312,10 @@ class SceneAdjuster:
             unreal.log_warning("Invalid adjustment: missing actor or type")
             return False
 
+        # Known sequence-only binding: skip the level actor scan entirely
+        if adjustment.get('scope', 'auto') == 'sequence' and self.sequence_asset:
+            return self.apply_adjustment_to_sequence(actor_name, adjustment)
+
         # Try to find actor in level first
         actor = self.find_actor_by_name(actor_name)
 
@@ -212,16 +341,17 @@ class SceneAdjuster:
         """Apply adjustment directly to sequence binding by setting keyframes in transform tracks"""
         try:
             # Ensure sequence is open in editor (required for channel access)
-            unreal.LevelSequenceEditorBlueprintLibrary.open_level_sequence(self.sequence_asset)
-
-            bindings = self.sequence_asset.get_bindings()
+            if not self._batching:
+                unreal.LevelSequenceEditorBlueprintLibrary.open_level_sequence(self.sequence_asset)
 
             # Find the binding
+            actor_lname = actor_name.lower()
             target_binding = None
-            for binding in bindings:
-                binding_name = str(binding.get_display_name())
-                if actor_name.lower() in binding_name.lower():
+            target_lname = ''
+            for _, binding_lname, binding in self._get_binding_index():
+                if actor_lname in binding_lname:
                     target_binding = binding
+                    target_lname = binding_lname
                     break
 
             if not target_binding:
@@ -260,33 +390,10 @@ class SceneAdjuster:
             if adj_type == 'move' and 'position' in adjustment:
                 pos = adjustment['position']
 
-                # Read current values at frame 0 (if they exist)
-                current_x = 0.0
-                current_y = 0.0
-                current_z = 0.0
-
-                # Try to get existing keyframe values
-                try:
-                    all_keys_x = channels[0].get_keys()
-                    all_keys_y = channels[1].get_keys()
-                    all_keys_z = channels[2].get_keys()
-
-                    # Find keyframe at frame 0
-                    for key in all_keys_x:
-                        if key.get_time().frame_number.value == 0:
-                            current_x = key.get_value()
-                            break
-                    for key in all_keys_y:
-                        if key.get_time().frame_number.value == 0:
-                            current_y = key.get_value()
-                            break
-                    for key in all_keys_z:
-                        if key.get_time().frame_number.value == 0:
-                            current_z = key.get_value()
-                            break
-
-                except:
-                    pass
+                # Read current values at frame 0 (channels already checked to hold 9 entries)
+                current_x = self._get_frame_zero_value(channels[0])
+                current_y = self._get_frame_zero_value(channels[1])
+                current_z = self._get_frame_zero_value(channels[2])
 
                 # Apply positioning based on mode
                 if self.use_absolute_positioning:
@@ -301,20 +408,11 @@ class SceneAdjuster:
                     new_z = current_z + float(pos['z'])
 
                 # VALIDATE POSITIONS: Prevent impossible locations
-                binding_name = str(target_binding.get_display_name()).lower()
-                is_camera = 'camera' in binding_name
+                is_camera = 'camera' in target_lname
 
                 # Determine bounds
-                if is_camera:
-                    # Camera bounds: reasonable positioning around scene origin
-                    min_x, max_x = -2000.0, 2000.0
-                    min_y, max_y = -2000.0, 2000.0
-                    min_z, max_z = 50.0, 1000.0  # Never underground, max 10m height
-                else:
-                    # Actor bounds (characters, props)
-                    min_x, max_x = -5000.0, 5000.0  # Wide range for placement
-                    min_y, max_y = -5000.0, 5000.0
-                    min_z, max_z = -10.0, 300.0  # Ground level ±10cm to 3m height
+                (min_x, min_y, min_z), (max_x, max_y, max_z) = \
+                    self._CAMERA_BOUNDS if is_camera else self._ACTOR_BOUNDS
 
                 # Clamp values
                 original_x, original_y, original_z = new_x, new_y, new_z
@@ -332,7 +430,8 @@ class SceneAdjuster:
                 channels[2].add_key(frame, new_z)
 
                 unreal.log(f"Set position keyframes at frame 0")
-                unreal.LevelSequenceEditorBlueprintLibrary.refresh_current_level_sequence()
+                if not self._batching:
+                    unreal.LevelSequenceEditorBlueprintLibrary.refresh_current_level_sequence()
                 return True
 
             elif adj_type == 'rotate' and 'rotation' in adjustment:
@@ -350,7 +449,8 @@ class SceneAdjuster:
                 channels[5].add_key(frame, yaw)     # Yaw
 
                 unreal.log("Set rotation keyframes at frame 0")
-                unreal.LevelSequenceEditorBlueprintLibrary.refresh_current_level_sequence()
+                if not self._batching:
+                    unreal.LevelSequenceEditorBlueprintLibrary.refresh_current_level_sequence()
                 return True
 
             else:
@@ -366,18 +466,24 @@ class SceneAdjuster:
         if not self.sequence_asset:
             return None
 
-        try:
-            bindings = self.sequence_asset.get_bindings()
+        cached_name = self._camera_name_cache.get(camera_pattern)
+        if cached_name:
+            return cached_name
 
-            for binding in bindings:
-                binding_name = str(binding.get_display_name())
+        try:
+            pattern_lname = camera_pattern.lower()
 
+            for binding_name, binding_lname, _ in self._get_binding_index():
                 # Look for Hero camera or CineCameraActor
-                if camera_pattern.lower() in binding_name.lower() and "camera" in binding_name.lower():
+                if pattern_lname in binding_lname and "camera" in binding_lname:
                     unreal.log(f"Found camera: '{binding_name}'")
+                    self._camera_name_cache[camera_pattern] = binding_name
                     return binding_name
 
             unreal.log_warning(f"Camera with pattern '{camera_pattern}' not found")
+            # Misses are not cached: rebuild the binding index on the next call
+            # so a camera bound to the sequence later is still found
+            self.invalidate_binding_cache()
             return None
 
         except Exception as e:
@@ -395,37 +501,38 @@ class SceneAdjuster:
         Returns:
             {pitch, yaw, roll} rotation values in degrees
         """
-        import math
-
-        # SIMPLIFIED FOR T-POSE PROOF-OF-CONCEPT:
-        # Characters at Z=0 (ground level), height ~170 units
-        # For medium shot, look at chest/head level (~85-100 units up)
-        # target_pos is already the look-at point (center between characters)
-        # Add offset to look at mid-body height for better framing
-        head_offset = 85.0  # Look at chest level for medium shot (half character height)
-        target_head_z = target_pos['z'] + head_offset
-
-        # Direction vector from camera to target HEAD
-        dx = target_pos['x'] - camera_pos['x']
-        dy = target_pos['y'] - camera_pos['y']
-        dz = target_head_z - camera_pos['z']  # Look at HEAD, not feet
+        # Direction vector from camera to target HEAD (look at HEAD, not feet)
+        # float() keeps a single compiled signature when the kernel is numba-jitted
+        pitch, yaw = _look_at_angles(
+            float(target_pos['x'] - camera_pos['x']),
+            float(target_pos['y'] - camera_pos['y']),
+            float(target_pos['z'] + LOOK_AT_HEAD_OFFSET - camera_pos['z'])
+        )
 
-        # Calculate horizontal distance
-        horizontal_dist = math.sqrt(dx*dx + dy*dy)
-
-        # Calculate yaw (left/right rotation around Z-axis)
-        # atan2(dy, dx) gives angle in XY plane
-        yaw = math.degrees(math.atan2(dy, dx))
+        # Roll usually 0 for cameras
+        return {'pitch': pitch, 'yaw': yaw, 'roll': 0.0}
+
+    def _get_binding_position(self, binding_name: str, binding) -> Optional[Dict]:
+        """Get a binding's {x, y, z} position from its transform keyframes at frame 0"""
+        # Get transform track
+        transform_tracks = binding.find_tracks_by_exact_type(unreal.MovieScene3DTransformTrack)
+        if not transform_tracks:
+            unreal.log_warning(f"No transform track for {binding_name}")
+            return None
 
-        # Calculate pitch (up/down rotation)
-        # Unreal: negative pitch = look down, positive pitch = look up
-        # atan2 gives correct sign: negative dz (target below) → negative angle → look down
-        pitch = math.degrees(math.atan2(dz, horizontal_dist))
+        section = transform_tracks[0].get_sections()[0]
+        channels = section.get_all_channels()
 
-        # Roll usually 0 for cameras
-        roll = 0.0
+        if not channels or len(channels) < 3:
+            unreal.log_warning(f"Invalid channels for {binding_name}")
+            return None
 
-        return {'pitch': pitch, 'yaw': yaw, 'roll': roll}
+        # Get position at frame 0 (channels [0-2] are Location X/Y/Z)
+        return {
+            'x': self._get_frame_zero_value(channels[0]),
+            'y': self._get_frame_zero_value(channels[1]),
+            'z': self._get_frame_zero_value(channels[2])
+        }
 
     def _get_actor_position_from_sequence(self, actor_name: str, skip_cameras: bool = True) -> Optional[Dict]:
         """
@@ -442,56 +549,23 @@ class SceneAdjuster:
             return None
 
         try:
-            bindings = self.sequence_asset.get_bindings()
+            actor_lname = actor_name.lower()
 
-            for binding in bindings:
-                binding_name = str(binding.get_display_name())
-
-                # Optionally skip cameras and lights
-                if skip_cameras and ('camera' in binding_name.lower() or 'light' in binding_name.lower()):
-                    continue
+            # Optionally skip cameras and lights
+            bindings = self._get_character_bindings() if skip_cameras else self._get_binding_index()
 
+            for binding_name, binding_lname, binding in bindings:
                 # Check if this is the actor we're looking for
-                if actor_name.lower() in binding_name.lower():
-                    # Get transform track
-                    transform_tracks = binding.find_tracks_by_exact_type(unreal.MovieScene3DTransformTrack)
-                    if not transform_tracks:
-                        continue
-
-                    section = transform_tracks[0].get_sections()[0]
-                    channels = section.get_all_channels()
-
-                    if not channels or len(channels) < 3:
-                        continue
-
-                    # Get position at frame 0 (channels [0-2] are Location X/Y/Z)
-                    x_val = 0.0
-                    y_val = 0.0
-                    z_val = 0.0
-
-                    # Get keyframes from each channel
-                    all_keys_x = channels[0].get_keys()
-                    all_keys_y = channels[1].get_keys()
-                    all_keys_z = channels[2].get_keys()
-
-                    # Find keyframe at frame 0
-                    for key in all_keys_x:
-                        if key.get_time().frame_number.value == 0:
-                            x_val = key.get_value()
-                            break
-                    for key in all_keys_y:
-                        if key.get_time().frame_number.value == 0:
-                            y_val = key.get_value()
-                            break
-                    for key in all_keys_z:
-                        if key.get_time().frame_number.value == 0:
-                            z_val = key.get_value()
-                            break
+                if actor_lname in binding_lname:
+                    position = self._get_binding_position(binding_name, binding)
+                    if position:
+                        return position
 
-                    return {'x': x_val, 'y': y_val, 'z': z_val}
+            unreal.log_warning(f"'{actor_name}' not found in sequence")
 
         except Exception as e:
             unreal.log_error(f"Error getting actor position: {e}")
+            unreal.log_error(traceback.format_exc())
 
         return None
 
@@ -508,65 +582,10 @@ class SceneAdjuster:
         if not self.sequence_asset:
             return None
 
-        try:
-            bindings = self.sequence_asset.get_bindings()
-
-            for binding in bindings:
-                binding_name = str(binding.get_display_name())
-
-                # Skip cameras and lights
-                if 'camera' in binding_name.lower() or 'light' in binding_name.lower():
-                    continue
-
-                # Check if this is the character we're looking for
-                if character_name.lower() in binding_name.lower():
-                    # Get transform track
-                    transform_tracks = binding.find_tracks_by_exact_type(unreal.MovieScene3DTransformTrack)
-                    if not transform_tracks:
-                        unreal.log_warning(f"No transform track for {binding_name}")
-                        continue
-
-                    section = transform_tracks[0].get_sections()[0]
-                    channels = section.get_all_channels()
-
-                    if not channels or len(channels) < 3:
-                        unreal.log_warning(f"Invalid channels for {binding_name}")
-                        continue
-
-                    # Get position at frame 0 (channels [0-2] are Location X/Y/Z)
-                    # Read keyframe values at frame 0
-                    x_val = 0.0
-                    y_val = 0.0
-                    z_val = 0.0
-
-                    # Get keyframes from each channel
-                    all_keys_x = channels[0].get_keys()
-                    all_keys_y = channels[1].get_keys()
-                    all_keys_z = channels[2].get_keys()
-
-                    # Find keyframe at frame 0
-                    for key in all_keys_x:
-                        if key.get_time().frame_number.value == 0:
-                            x_val = key.get_value()
-                            break
-                    for key in all_keys_y:
-                        if key.get_time().frame_number.value == 0:
-                            y_val = key.get_value()
-                            break
-                    for key in all_keys_z:
-                        if key.get_time().frame_number.value == 0:
-                            z_val = key.get_value()
-                            break
-
-                    unreal.log(f"Found character '{binding_name}' at: X={x_val:.1f}, Y={y_val:.1f}, Z={z_val:.1f}")
-                    return {'x': x_val, 'y': y_val, 'z': z_val}
-
-            unreal.log_warning(f"Character '{character_name}' not found in sequence")
-
-        except Exception as e:
-            unreal.log_error(f"Error getting character position: {e}")
-            import traceback
-            unreal.log_error(traceback.format_exc())
+        position = self._get_actor_position_from_sequence(character_name, skip_cameras=True)
+        if position:
+            unreal.log(f"Found character '{character_name}' at: X={position['x']:.1f}, Y={position['y']:.1f}, Z={position['z']:.1f}")
+            return position
 
         # Fallback: assume origin with sitting head height for framing
         # If character is at Z=90 (sitting simulation), head is at ~Z=140 (90 base + 50 head offset)
@@ -615,9 +634,8 @@ class SceneAdjuster:
                     camera_current_pos = self._get_actor_position_from_sequence(camera_name, skip_cameras=False)
 
                     # Get characters' average X position to determine "front" vs "behind"
-                    character_names = ['Oat', 'Sprout']
                     character_x_positions = []
-                    for char_name in character_names:
+                    for char_name in self._CHAR_NAMES:
                         char_pos = self.get_character_position_from_sequence(char_name)
                         if char_pos:
                             character_x_positions.append(char_pos['x'])
@@ -637,6 +655,7 @@ class SceneAdjuster:
                 pos_adjustment = {
                     'actor': camera_name,
                     'type': 'move',
+                    'scope': 'sequence',
                     'position': new_camera_pos,
                     'reason': camera_adjustments.get('reason', 'Camera repositioning')
                 }
@@ -647,19 +666,14 @@ class SceneAdjuster:
 
             # CRITICAL: Calculate look-at rotation to point camera at character(s)
             if new_camera_pos:
-                unreal.log(f"\n Calculating look-at rotation...")
-
                 # IMPROVED: For multiple characters, look at CENTER point between them
                 # This gives better medium shot framing than focusing on one character
-                character_names_to_try = ['Oat', 'Sprout']
                 character_positions = []
 
-                unreal.log(f"Searching for characters: {character_names_to_try}")
-                for char_name in character_names_to_try:
+                for char_name in self._CHAR_NAMES:
                     pos = self.get_character_position_from_sequence(char_name)
                     if pos:
                         character_positions.append(pos)
-                        unreal.log(f"Found {char_name} at: X={pos['x']:.1f}, Y={pos['y']:.1f}, Z={pos['z']:.1f}")
                     else:
                         unreal.log_warning(f"Could not find {char_name} in sequence")
 
@@ -667,52 +681,58 @@ class SceneAdjuster:
                 target_pos = None
                 if len(character_positions) > 1:
                     # Multiple characters: use center point for balanced framing
-                    avg_x = sum(p['x'] for p in character_positions) / len(character_positions)
-                    avg_y = sum(p['y'] for p in character_positions) / len(character_positions)
-                    avg_z = sum(p['z'] for p in character_positions) / len(character_positions)
-                    target_pos = {'x': avg_x, 'y': avg_y, 'z': avg_z}
-                    unreal.log(f"Using center point between {len(character_positions)} characters")
+                    avg_x = avg_y = avg_z = 0.0
+                    for p in character_positions:
+                        avg_x += p['x']
+                        avg_y += p['y']
+                        avg_z += p['z']
+                    inv_count = 1.0 / len(character_positions)
+                    target_pos = {'x': avg_x * inv_count, 'y': avg_y * inv_count, 'z': avg_z * inv_count}
+                    target_source = f"center point between {len(character_positions)} characters"
                 elif len(character_positions) == 1:
                     # Single character: look at that character
                     target_pos = character_positions[0]
-                    unreal.log(f"Using single character position")
+                    target_source = "single character position"
                 else:
                     # Fallback: look at any non-camera actor
-                    unreal.log("Looking for any character in scene...")
+                    target_source = "first character found in scene"
                     try:
-                        bindings = self.sequence_asset.get_bindings()
-                        for binding in bindings:
-                            binding_name = str(binding.get_display_name()).lower()
-                            if 'camera' not in binding_name and 'light' not in binding_name:
-                                target_pos = self.get_character_position_from_sequence(str(binding.get_display_name()))
-                                if target_pos:
-                                    break
-                    except:
-                        pass
+                        character_bindings = self._get_character_bindings()
+                    except (AttributeError, RuntimeError) as e:
+                        unreal.log_warning(f"Could not read sequence bindings: {e}")
+                        character_bindings = []
+
+                    # Read the matched binding directly instead of re-searching the index by name
+                    for binding_name, _, binding in character_bindings:
+                        try:
+                            target_pos = self._get_binding_position(binding_name, binding)
+                        except (AttributeError, RuntimeError, IndexError) as e:
+                            unreal.log_warning(f"Could not read position for {binding_name}: {e}")
+                            continue
+                        if target_pos:
+                            break
 
                 if target_pos:
-                    #  DIAGNOSTIC: Log what target_pos we're using for look-at
-                    unreal.log(f"\n DIAGNOSTIC: Look-at calculation inputs:")
-                    unreal.log(f"Camera position: X={new_camera_pos['x']:.1f}, Y={new_camera_pos['y']:.1f}, Z={new_camera_pos['z']:.1f}")
-                    unreal.log(f"Target position: X={target_pos['x']:.1f}, Y={target_pos['y']:.1f}, Z={target_pos['z']:.1f}")
-                    unreal.log(f"Target with head_offset (+85): Z={target_pos['z'] + 85.0:.1f}")
-
                     # Calculate rotation to look at target
                     calculated_rotation = self.calculate_look_at_rotation(new_camera_pos, target_pos)
 
-                    unreal.log(f"Look-at target: X={target_pos['x']:.1f}, Y={target_pos['y']:.1f}, Z={target_pos['z']:.1f}")
-                    unreal.log(f"Calculated rotation:")
-                    unreal.log(f"Pitch={calculated_rotation['pitch']:.1f}° (up/down tilt)")
-                    unreal.log(f"Yaw={calculated_rotation['yaw']:.1f}° (left/right turn)")
-                    unreal.log(f"Roll={calculated_rotation['roll']:.1f}° (camera tilt)")
+                    #  DIAGNOSTIC: Log look-at inputs and result in a single call
+                    if self._verbose:
+                        unreal.log(
+                            f"\n DIAGNOSTIC: Look-at calculation ({target_source}):\n"
+                            f"Camera position: X={new_camera_pos['x']:.1f}, Y={new_camera_pos['y']:.1f}, Z={new_camera_pos['z']:.1f}\n"
+                            f"Target position: X={target_pos['x']:.1f}, Y={target_pos['y']:.1f}, Z={target_pos['z']:.1f}\n"
+                            f"Target with head_offset (+{LOOK_AT_HEAD_OFFSET:.0f}): Z={target_pos['z'] + LOOK_AT_HEAD_OFFSET:.1f}\n"
+                            f"Calculated rotation:\n"
+                            f"Pitch={calculated_rotation['pitch']:.1f}° (up/down tilt)\n"
+                            f"Yaw={calculated_rotation['yaw']:.1f}° (left/right turn)\n"
+                            f"Roll={calculated_rotation['roll']:.1f}° (camera tilt)"
+                        )
 
                     # Apply the calculated rotation
-                    rot_adjustment = {
-                        'actor': camera_name,
-                        'type': 'rotate',
-                        'rotation': calculated_rotation,
-                        'reason': 'Auto-calculated look-at rotation'
-                    }
+                    rot_adjustment = self._rot_scratch
+                    rot_adjustment['actor'] = camera_name
+                    rot_adjustment['rotation'] = calculated_rotation
                     if not self.apply_adjustment_to_sequence(camera_name, rot_adjustment):
                         success = False
                     else:
@@ -731,94 +751,105 @@ class SceneAdjuster:
 
         except Exception as e:
             unreal.log_error(f"Error applying camera adjustment: {e}")
-            import traceback
             unreal.log_error(traceback.format_exc())
             return False
 
     def apply_all_adjustments(self, ai_response: Dict[str, Any]) -> Dict[str, int]:
-        """Apply all adjustments from AI response (actors + camera)"""
-        unreal.log("\n" + "="*70)
-        unreal.log("APPLYING AI RECOMMENDATIONS")
-        unreal.log("="*70)
-
-        results = {
-            'total': 0,
-            'success': 0,
-            'failed': 0,
-            'camera_applied': False
-        }
+        """
+        Apply all adjustments from AI response (actors + camera)
+
+        All edits share one undo transaction; the sequence is opened once up front
+        and refreshed once at the end instead of per keyframe edit.
+        """
+        with unreal.ScopedEditorTransaction("Apply AI Recommendations"):
+            if not self.sequence_asset:
+                return self._apply_all_adjustments(ai_response)
+
+            unreal.LevelSequenceEditorBlueprintLibrary.open_level_sequence(self.sequence_asset)
+            self.sequence_asset.modify()
+            self._batching = True
+            try:
+                return self._apply_all_adjustments(ai_response)
+            finally:
+                self._batching = False
+                unreal.LevelSequenceEditorBlueprintLibrary.refresh_current_level_sequence()
+
+    def _apply_all_adjustments(self, ai_response: Dict[str, Any]) -> Dict[str, int]:
+        """Apply actor + camera adjustments (called by apply_all_adjustments)"""
+        unreal.log(_APPLYING_RECOMMENDATIONS_HEADER)
 
         # Apply actor adjustments
         adjustments = ai_response.get('adjustments', [])
+        total = len(adjustments)
+        success = 0
+        camera_applied = False
 
         if adjustments:
-            unreal.log(f"\nFound {len(adjustments)} actor adjustments to apply\n")
+            unreal.log(f"\nFound {total} actor adjustments to apply\n")
 
             for i, adjustment in enumerate(adjustments, 1):
-                results['total'] += 1
-
-                actor_name = adjustment.get('actor', 'Unknown')
-                adj_type = adjustment.get('type', 'unknown')
-                reason = adjustment.get('reason', 'No reason provided')
-
-                unreal.log(f"[{i}/{len(adjustments)}] {actor_name} ({adj_type}): {reason}")
+                if self._verbose:
+                    actor_name = adjustment.get('actor', 'Unknown')
+                    adj_type = adjustment.get('type', 'unknown')
+                    reason = adjustment.get('reason', 'No reason provided')
+                    unreal.log(f"[{i}/{total}] {actor_name} ({adj_type}): {reason}")
 
                 if self.apply_adjustment(adjustment):
-                    results['success'] += 1
-                else:
-                    results['failed'] += 1
+                    success += 1
         else:
             unreal.log("\nNo actor adjustments needed\n")
 
+        failed = total - success
+
         # Apply camera adjustments
         camera_adjustments = ai_response.get('camera_adjustments', {})
         if camera_adjustments:
-            unreal.log("="*70)
-            unreal.log("APPLYING CAMERA ADJUSTMENTS")
-            unreal.log("="*70 + "\n")
+            unreal.log(_APPLYING_CAMERA_HEADER)
 
-            if self.apply_camera_adjustment(camera_adjustments):
-                results['camera_applied'] = True
-                unreal.log("Camera adjustments applied")
-            else:
+            camera_applied = self.apply_camera_adjustment(camera_adjustments)
+            if not camera_applied:
                 unreal.log_warning("Camera adjustments failed")
 
         # Summary
-        unreal.log("="*70)
-        unreal.log(f"Applied {results['success']}/{results['total']} actor adjustments")
-        if results['failed'] > 0:
-            unreal.log_warning(f"Failed: {results['failed']}")
-        if results['camera_applied']:
-            unreal.log("Camera adjustments applied")
-        unreal.log("="*70 + "\n")
+        summary = f"{_BANNER}\nApplied {success}/{total} actor adjustments"
+        if camera_applied:
+            summary += "\nCamera adjustments applied"
+        unreal.log(f"{summary}\n{_BANNER_NL}")
+        if failed > 0:
+            unreal.log_warning(f"Failed: {failed}")
+
+        return {
+            'total': total,
+            'success': success,
+            'failed': failed,
+            'camera_applied': camera_applied
+        }
+
 
-        return results
+# Sample AI response (like what you got) - read-only, apply_all_adjustments never mutates it
+_SAMPLE_RESPONSE = MappingProxyType({
+    "match_score": 60,
+    "analysis": "Test adjustment",
+    "adjustments": (
+        MappingProxyType({
+            "actor": "Oat",
+            "type": "move",
+            "reason": "Oat needs to be seated",
+            "position": MappingProxyType({"x": 0, "y": -0.5, "z": 0})
+        }),
+        MappingProxyType({
+            "actor": "Oat",
+            "type": "rotate",
+            "reason": "Face forward",
+            "rotation": MappingProxyType({"pitch": 0, "yaw": 180, "roll": 0})
+        })
+    )
+})
 
 
 def test_scene_adjuster():
     """Test the scene adjuster with a sample AI response"""
-
-    # Sample AI response (like what you got)
-    sample_response = {
-        "match_score": 60,
-        "analysis": "Test adjustment",
-        "adjustments": [
-            {
-                "actor": "Oat",
-                "type": "move",
-                "reason": "Oat needs to be seated",
-                "position": {"x": 0, "y": -0.5, "z": 0}
-            },
-            {
-                "actor": "Oat",
-                "type": "rotate",
-                "reason": "Face forward",
-                "rotation": {"pitch": 0, "yaw": 180, "roll": 0}
-            }
-        ]
-    }
-
     adjuster = SceneAdjuster()
-    results = adjuster.apply_all_adjustments(sample_response)
+    results = adjuster.apply_all_adjustments(_SAMPLE_RESPONSE)
 
     return results
@@ -20,8 +20,97 @@ The build order follows production logic:
 """
 
 import unreal
-from typing import Optional, Dict, Any, List
+import json
+import traceback
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, List, Tuple
+from core.asset_matcher import AssetMatcher
+from core.configs import ActorConfig, SpawnSpec
+from core.debug_logger import logger, LogLevel
+from core.entity_validator import validate_actors
 from core.error_handler import OperationErrorCollector
+from core.sequence_generator import SequenceGenerator
+from core.settings_manager import get_setting
+from core.utils import get_show_asset_library_path
+
+# Shared default structs for spawn configs. Configs only read these (keyframe
+# values are copied out of them), so one instance per process is enough.
+_ZERO_VEC = unreal.Vector(0, 0, 0)
+_ZERO_ROT = unreal.Rotator(0, 0, 0)
+_WHITE = unreal.LinearColor(r=1.0, g=1.0, b=1.0)
+_FRAME0 = unreal.FrameNumber(0)
+
+# Reflected class handles, resolved once instead of per call
+_TRANSFORM_TRACK = unreal.MovieScene3DTransformTrack
+_CUT_TRACK = unreal.MovieSceneCameraCutTrack
+_CINE_CAMERA = unreal.CineCameraActor
+_POINT_LIGHT = unreal.PointLight
+_STATIC_MESH_ACTOR = unreal.StaticMeshActor
+
+# shot_type -> (camera distance, focal length)
+_SHOT_TABLE = {
+    'close': (150, 85.0),
+    'close_up': (300, 85.0),
+    'close-up': (300, 85.0),
+    'extreme_close': (300, 85.0),
+    'medium': (300, 50.0),
+    'wide': (600, 24.0),
+    'extreme_wide': (1000, 24.0),
+}
+
+# Location names that carry no level to load and fall back to the default level
+_GENERIC_LOCATIONS = frozenset({'Exterior', 'Interior', 'Auto-detect'})
+# Location names that are never looked up in the show's location library
+_AMBIGUOUS_LOCATIONS = frozenset({'Location Unknown', 'Auto-detect', 'Unknown', 'Default'})
+
+# mood -> base light intensity; unlisted moods use _DEFAULT_MOOD_BASE
+_MOOD_BASE = {'dark': 1000.0, 'bright': 3000.0}
+_DEFAULT_MOOD_BASE = 2000.0
+
+# Three-point lighting: (name, position, fraction of the mood base intensity)
+_LIGHT_SPEC = (
+    ('Key Light', unreal.Vector(-300, -200, 400), 1.0),
+    ('Fill Light', unreal.Vector(-300, 200, 350), 0.5),
+    ('Rim Light', unreal.Vector(400, 0, 300), 0.3),
+)
+
+
+def _configure_cine_camera(object_template: Any, spec: SpawnSpec) -> None:
+    """Apply storyboard lens and focus settings to a spawnable CineCameraActor template."""
+    camera_component = object_template.get_cine_camera_component()
+    if not camera_component:
+        return
+
+    camera_component.filmback.sensor_width = 36.0
+    camera_component.filmback.sensor_height = 24.0
+    camera_component.current_focal_length = spec.focal_length
+    camera_component.current_aperture = 2.8
+
+    focus_settings = camera_component.focus_settings
+    focus_settings.focus_method = unreal.CameraFocusMethod.DISABLE
+    camera_component.set_editor_property('focus_settings', focus_settings)
+
+    post_process = camera_component.post_process_settings
+    post_process.override_depth_of_field_fstop = True
+    post_process.depth_of_field_fstop = 32.0
+    post_process.override_depth_of_field_focal_distance = True
+    post_process.depth_of_field_focal_distance = 100000.0
+    camera_component.set_editor_property('post_process_settings', post_process)
+
+
+def _configure_point_light(object_template: Any, spec: SpawnSpec) -> None:
+    """Apply intensity and color to a spawnable PointLight template."""
+    light_component = object_template.point_light_component
+    if light_component:
+        light_component.set_intensity(spec.intensity)
+        light_component.set_light_color(spec.color)
+
+
+# actor class -> template configurator, used by SceneBuilder._apply_spawn_config
+_SPAWNABLE_CONFIGURATORS = {
+    _CINE_CAMERA: _configure_cine_camera,
+    _POINT_LIGHT: _configure_point_light,
+}
 
 
 class SceneBuilder:
@@ -45,6 +134,9 @@ class SceneBuilder:
         >>> print(f"Created {len(scene['characters'])} characters")
     """
 
+    # Placeholder cube mesh, loaded once per process on first use
+    _cube_cache = None
+
     def __init__(self, show_name: Optional[str] = None):
         """
         Initialize the scene builder.
@@ -56,9 +148,19 @@ class SceneBuilder:
         self.world = None
         self.actors: List[Any] = []
         self.show_name = show_name
-        
-        from core.asset_matcher import AssetMatcher
-        from core.sequence_generator import SequenceGenerator
+
+        # (st_mtime_ns, parsed asset_library.json, lowercase name index) - rebuilt only when the file changes
+        self._library_cache: Optional[Tuple[int, Dict[str, Any], Dict[str, Any]]] = None
+        # (category, name) -> resolved asset path, valid for the cached library only
+        self._match_cache: Dict[Tuple[str, str], Optional[str]] = {}
+        # asset_path -> loaded blueprint class, reused for repeat characters across panels
+        self._bp_class_cache: Dict[str, Any] = {}
+        # asset_path -> exists, filled during one build_scene so each path hits the registry once
+        self._asset_exists_cache: Dict[str, bool] = {}
+        # panel_index -> sequence data, filled once per batch_build_scenes
+        self._sequence_pool: Dict[int, Dict[str, Any]] = {}
+        # panel_index -> path of each sequence asset created during the current batch
+        self._created_sequences: Dict[int, str] = {}
         
         self.asset_matcher = AssetMatcher(show_name=show_name)
         self.sequence_generator = SequenceGenerator(show_name=show_name)
@@ -101,9 +203,110 @@ class SceneBuilder:
             >>> analysis = {'characters': ['Hero'], 'shot_type': 'medium'}
             >>> scene = builder.build_scene(analysis, panel_index=1)
         """
-        from core.entity_validator import validate_actors
+        return self.batch_build_scenes([analysis], panel_index, auto_camera, auto_lighting)[0]
+
+    def batch_build_scenes(self, analyses: List[Dict[str, Any]], start_index: int = 0,
+                           auto_camera: bool = True, auto_lighting: bool = True) -> List[Optional[Dict[str, Any]]]:
+        """
+        Build scenes for several panels in one editor transaction.
+        
+        The viewport is frozen once for the whole batch and every panel's
+        sequence asset is loaded or created up front, so the per-panel work
+        only reuses pooled assets instead of hitting the registry each time.
+        Multi-panel batches save the sequences of successful panels once at
+        the end; sequences the batch created for failed panels are deleted.
+        
+        Args:
+            analyses: Panel analysis dictionaries, see build_scene.
+            start_index: Panel index of the first analysis (default 0).
+            auto_camera: Whether to create cameras automatically (default True).
+            auto_lighting: Whether to create lighting automatically (default True).
+        
+        Returns:
+            One scene data dictionary per analysis, None where a panel failed.
+            The transaction is canceled only if every panel failed.
+        
+        Example:
+            >>> scenes = builder.batch_build_scenes(analyses, start_index=1)
+        """
+        if not analyses:
+            return []
+
+        for analysis in analyses:
+            self._validate_analysis_characters(analysis)
 
-        # Validate AI-suggested characters against available assets
+        # Resolve every distinct asset name before any editor work starts
+        if len(analyses) > 1:
+            self._prepare_batch_asset_paths(analyses)
+
+        self._asset_exists_cache.clear()
+
+        panel_indices = range(start_index, start_index + len(analyses))
+        if len(analyses) == 1:
+            label = f"Generate Panel {start_index}"
+        else:
+            label = f"Generate Panels {start_index}-{panel_indices[-1]}"
+
+        results: List[Optional[Dict[str, Any]]] = []
+        with unreal.ScopedEditorTransaction(label) as trans, self._viewport_frozen():
+            self.world = unreal.EditorLevelLibrary.get_editor_world()
+            if not self.world:
+                unreal.log_error("No editor world found")
+                trans.cancel()
+                return [None] * len(analyses)
+
+            defer_save = len(analyses) > 1
+            self._created_sequences = {}
+            self._sequence_pool = self._prepare_sequences(panel_indices)
+            try:
+                for panel_index, analysis in zip(panel_indices, analyses):
+                    results.append(self._build_panel(analysis, panel_index, auto_camera, auto_lighting,
+                                                     defer_save))
+            finally:
+                self._sequence_pool = {}
+                self._finish_batch_sequences(panel_indices, results, defer_save)
+
+            if not any(results):
+                trans.cancel()
+
+        return results
+
+    def _finish_batch_sequences(self, panel_indices: range, results: List[Optional[Dict[str, Any]]],
+                                defer_save: bool) -> None:
+        """
+        Save the sequences of panels that built and drop those of failed panels.
+        
+        Runs once the outcome of every panel is known. Panels missing from
+        results (an exception cut the batch short) count as failed.
+        
+        Args:
+            panel_indices: Panel indices of the batch.
+            results: Scene data per built panel, None where a panel failed.
+            defer_save: Whether panel sequences were left unsaved for this call.
+        """
+        created = self._created_sequences
+        self._created_sequences = {}
+
+        succeeded = []
+        for position, panel_index in enumerate(panel_indices):
+            scene_data = results[position] if position < len(results) else None
+            if scene_data:
+                succeeded.append(scene_data['sequence']['asset'])
+            elif panel_index in created:
+                # Asset creation is not undone by canceling the transaction
+                unreal.log_warning(f"Deleting sequence of failed panel {panel_index}: {created[panel_index]}")
+                unreal.EditorAssetLibrary.delete_asset(created[panel_index])
+
+        if defer_save and succeeded:
+            unreal.EditorAssetLibrary.save_loaded_assets(succeeded, only_if_is_dirty=True)
+
+    def _validate_analysis_characters(self, analysis: Dict[str, Any]) -> None:
+        """
+        Drop AI-suggested characters that are not in the show's asset library.
+        
+        Args:
+            analysis: Panel analysis; its 'characters' list is replaced in place.
+        """
         available_actors = []
         if self.show_name and hasattr(self.asset_matcher, 'show_library'):
             lib_dict = self.asset_matcher.show_library.get('characters', {})
@@ -118,92 +321,184 @@ class SceneBuilder:
             validated_characters = validate_actors(ai_characters, available_actors)
             analysis['characters'] = validated_characters
 
-            rejected = set(ai_characters) - set(validated_characters)
+            validated_set = frozenset(validated_characters)
+            rejected = [c for c in ai_characters if c not in validated_set]
             if rejected:
                 unreal.log_error(f"BLOCKED HALLUCINATIONS: {rejected}")
             else:
                 unreal.log(f"All {len(validated_characters)} characters validated")
+
+    def _prepare_batch_asset_paths(self, analyses: List[Dict[str, Any]]) -> None:
+        """
+        Resolve the library paths of all characters and props in a batch.
+        
+        Fills the name-match memo once per distinct name so the per-panel
+        spawn steps only do dictionary hits.
+        
+        Args:
+            analyses: Validated panel analyses of the batch.
+        """
+        characters = {}
+        props = {}
+        for analysis in analyses:
+            characters.update(dict.fromkeys(analysis.get('characters', [])))
+            props.update(dict.fromkeys(analysis.get('props', []) or analysis.get('objects', [])))
+
+        if characters:
+            self._resolve_asset_paths(list(characters), 'characters')
+        if props:
+            self._resolve_asset_paths(list(props), 'props')
+
+    def _build_panel(self, analysis: Dict[str, Any], panel_index: int,
+                     auto_camera: bool, auto_lighting: bool,
+                     defer_save: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Run the production-ordered build steps for one panel.
+        
+        Must be called inside batch_build_scenes, which owns the transaction.
         
-        with unreal.ScopedEditorTransaction(f"Generate Panel {panel_index}") as trans:
-            unreal.log(f"Starting build_scene with panel_index={panel_index}")
+        Args:
+            analysis: Panel analysis dictionary.
+            panel_index: Index for sequence naming.
+            auto_camera: Whether to create camera automatically.
+            auto_lighting: Whether to create lighting automatically.
+            defer_save: Leave the sequence unsaved for the batch-level save.
+        
+        Returns:
+            Scene data dictionary, or None if the panel failed.
+        """
+        unreal.log(f"Starting build_scene with panel_index={panel_index}")
+        unreal.log("SCENE BUILDER: Starting production-ordered generation")
+        unreal.log("Order: Location -> Sequence -> Camera -> Characters -> Props -> Lighting -> Positioning")
+
+        scene_data = {
+            'panel_index': panel_index,
+            'location': None,
+            'sequence': None,
+            'actors': [],
+            'characters': [],
+            'props': [],
+            'lights': [],
+            'camera': None,
+            'positioning': {}
+        }
 
-            self.world = unreal.EditorLevelLibrary.get_editor_world()
-            if not self.world:
-                unreal.log_error("No editor world found")
-                trans.cancel()
-                return None
+        # STEP 1: Location/Environment
+        location_name = analysis.get('location') or analysis.get('location_type', 'Default')
+        if location_name in _GENERIC_LOCATIONS:
+            location_name = 'Default'
 
-            unreal.log("SCENE BUILDER: Starting production-ordered generation")
-            unreal.log("Order: Location -> Sequence -> Camera -> Characters -> Props -> Lighting -> Positioning")
-
-            scene_data = {
-                'panel_index': panel_index,
-                'location': None,
-                'sequence': None,
-                'actors': [],
-                'characters': [],
-                'props': [],
-                'lights': [],
-                'camera': None,
-                'positioning': {}
-            }
+        unreal.log(f"Resolved location: {location_name}")
+        ok, scene_data['location'] = self._run_step("location setup", self._setup_location, location_name, analysis)
+        if not ok:
+            return None
 
-            try:
-                # STEP 1: Location/Environment
-                location_name = analysis.get('location') or analysis.get('location_type', 'Default')
-                if location_name in ['Exterior', 'Interior', 'Auto-detect']:
-                    location_name = 'Default'
-                    
-                unreal.log(f"Resolved location: {location_name}")
-                scene_data['location'] = self._setup_location(location_name, analysis)
-
-                # STEP 2: Sequence
-                scene_data['sequence'] = self._create_sequence(panel_index, analysis)
-                if not scene_data['sequence'].get('asset'):
-                    unreal.log_error("Failed to create sequence - canceling")
-                    trans.cancel()
-                    return None
+        # STEP 2: Sequence
+        ok, scene_data['sequence'] = self._run_step("sequence creation", self._create_sequence, panel_index, analysis)
+        if not ok or not scene_data['sequence'].get('asset'):
+            unreal.log_error("Failed to create sequence - skipping panel")
+            return None
 
-                # STEP 3: Camera
-                if auto_camera:
-                    scene_data['camera'] = self._setup_initial_camera(analysis)
-
-                # STEP 4: Characters
-                scene_data['characters'] = self._spawn_characters(analysis)
-                scene_data['actors'].extend(scene_data['characters'])
-
-                # STEP 5: Props
-                scene_data['props'] = self._spawn_props(analysis)
-                scene_data['actors'].extend(scene_data['props'])
-
-                # STEP 6: Lighting
-                if auto_lighting:
-                    scene_data['lights'] = self._setup_lighting(analysis, scene_data['location'])
-
-                # STEP 7: Positioning
-                scene_data['positioning'] = self._position_actors(scene_data, analysis)
-                if scene_data['camera']:
-                    self._adjust_camera_framing(scene_data['camera'], scene_data)
-
-                # STEP 8: Add to sequence
-                if scene_data['sequence'].get('asset'):
-                    self._add_actors_to_sequence(scene_data)
-
-                # Summary
-                unreal.log(f"\nScene generation complete!")
-                unreal.log(f"Location: {scene_data['location'].get('type', 'Default')}")
-                unreal.log(f"Characters: {len(scene_data['characters'])}")
-                unreal.log(f"Props: {len(scene_data['props'])}")
-                unreal.log(f"Lights: {len(scene_data['lights'])}")
-                
-                return scene_data
+        # Steps 3-7 only build configs and handle their own per-entity errors
+        # STEP 3: Camera
+        if auto_camera:
+            scene_data['camera'] = self._setup_initial_camera(analysis)
 
-            except Exception as e:
-                unreal.log_error(f"Critical error in scene building: {e}")
-                import traceback
-                unreal.log_error(traceback.format_exc())
-                trans.cancel()
-                return None
+        # STEP 4: Characters
+        scene_data['characters'] = self._spawn_characters(analysis)
+
+        # STEP 5: Props
+        scene_data['props'] = self._spawn_props(analysis)
+        scene_data['actors'] = scene_data['characters'] + scene_data['props']
+
+        # STEP 6: Lighting
+        if auto_lighting:
+            scene_data['lights'] = self._setup_lighting(analysis, scene_data['location'])
+
+        # STEP 7: Positioning
+        scene_data['positioning'] = self._position_actors(scene_data, analysis)
+        if scene_data['camera']:
+            self._adjust_camera_framing(scene_data['camera'], scene_data)
+
+        # STEP 8: Add to sequence
+        ok, _ = self._run_step("sequence population", self._add_actors_to_sequence, scene_data, defer_save)
+        if not ok:
+            return None
+
+        # Summary
+        unreal.log(f"\nScene generation complete!")
+        unreal.log(f"Location: {scene_data['location'].get('type', 'Default')}")
+        unreal.log(f"Characters: {len(scene_data['characters'])}")
+        unreal.log(f"Props: {len(scene_data['props'])}")
+        unreal.log(f"Lights: {len(scene_data['lights'])}")
+
+        return scene_data
+
+    def _run_step(self, label: str, fn: Any, *args: Any) -> Tuple[bool, Any]:
+        """
+        Run one engine-facing build step, logging instead of raising on failure.
+        
+        Args:
+            label: Step name for the error log.
+            fn: Step callable.
+            *args: Arguments passed to fn.
+        
+        Returns:
+            (True, result) on success, (False, None) if fn raised.
+        """
+        try:
+            return True, fn(*args)
+        except Exception as e:
+            unreal.log_error(f"Critical error in scene building ({label}): {e}")
+            unreal.log_error(traceback.format_exc())
+            return False, None
+
+    @contextmanager
+    def _viewport_frozen(self):
+        """
+        Disable level viewport realtime rendering for a build, if opted in.
+        
+        Every level load, asset creation and spawnable edit otherwise triggers
+        a viewport redraw. LevelEditorSubsystem only exposes a setter for
+        realtime, so the prior state cannot be read back and realtime is
+        switched on when the block exits. The freeze is therefore off unless
+        performance.freeze_viewport_during_build is set, so viewports that
+        keep realtime off are left alone by default.
+        """
+        if not get_setting('performance.freeze_viewport_during_build', False):
+            yield
+            return
+
+        level_editor = unreal.get_editor_subsystem(unreal.LevelEditorSubsystem)
+        level_editor.editor_set_viewport_realtime(False)
+        try:
+            yield
+        finally:
+            level_editor.editor_set_viewport_realtime(True)
+            level_editor.editor_invalidate_viewports()
+
+    @property
+    def _placeholder_cube(self) -> Optional[unreal.StaticMesh]:
+        """Engine cube mesh used for placeholder spawnables (cached on the class)."""
+        if SceneBuilder._cube_cache is None:
+            SceneBuilder._cube_cache = unreal.EditorAssetLibrary.load_asset('/Engine/BasicShapes/Cube')
+        return SceneBuilder._cube_cache
+
+    def _asset_exists(self, asset_path: str) -> bool:
+        """
+        Check whether an asset exists, memoized for the current build.
+        
+        Args:
+            asset_path: Asset path to check.
+        
+        Returns:
+            True if the asset exists.
+        """
+        exists = self._asset_exists_cache.get(asset_path)
+        if exists is None:
+            exists = unreal.EditorAssetLibrary.does_asset_exist(asset_path)
+            self._asset_exists_cache[asset_path] = exists
+        return exists
 
     def _setup_location(self, location_name: str, analysis: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -220,20 +515,13 @@ class SceneBuilder:
 
         self.clear_build_area()
 
-        if self.show_name and location_name not in ['Location Unknown', 'Auto-detect', 'Unknown', 'Default']:
+        if self.show_name and location_name not in _AMBIGUOUS_LOCATIONS:
             unreal.log(f"Looking for location '{location_name}' in show '{self.show_name}'...")
 
             try:
-                from core.utils import get_shows_manager
-                import json
-
-                shows_manager = get_shows_manager()
-                library_path = shows_manager.shows_root / self.show_name / 'asset_library.json'
-
-                if library_path.exists():
-                    with open(library_path, 'r') as f:
-                        library = json.load(f)
+                library = self._get_asset_paths_from_library()
 
+                if library is not None:
                     locations = library.get('locations', {})
                     if location_name in locations:
                         location_info = locations[location_name]
@@ -248,9 +536,9 @@ class SceneBuilder:
                             location_data['loaded'] = success
                             
                             if success:
+                                # load_level is synchronous: the new world is ready as soon as it returns
+                                self.world = unreal.EditorLevelLibrary.get_editor_world()
                                 unreal.log(f"Level loaded: {location_name}")
-                                import time
-                                time.sleep(0.5)
                             else:
                                 unreal.log_error(f"Failed to load level: {location_path}")
 
@@ -264,10 +552,88 @@ class SceneBuilder:
 
         return location_data
 
+    def _sequence_directory(self) -> str:
+        """
+        Content folder that holds this show's panel sequences.
+        
+        Returns:
+            Package path, created on first use.
+        """
+        sequence_path = f"/Game/StoryboardSequences"
+        if self.show_name:
+            sequence_path = f"/Game/StoryboardSequences/{self.show_name}"
+
+        if not unreal.EditorAssetLibrary.does_directory_exist(sequence_path):
+            unreal.EditorAssetLibrary.make_directory(sequence_path)
+
+        return sequence_path
+
+    def _load_or_create_sequence(self, panel_index: int, sequence_path: str) -> Dict[str, Any]:
+        """
+        Load the panel's Level Sequence, creating it if it does not exist yet.
+        
+        Args:
+            panel_index: Panel index for naming.
+            sequence_path: Folder returned by _sequence_directory.
+        
+        Returns:
+            Sequence data dict with 'asset', 'path', 'name', or {} on failure.
+        """
+        sequence_name = f"Panel_{panel_index:03d}_Sequence"
+        full_path = f"{sequence_path}/{sequence_name}"
+
+        if unreal.EditorAssetLibrary.does_asset_exist(full_path):
+            sequence = unreal.EditorAssetLibrary.load_asset(full_path)
+            unreal.log(f"Using existing sequence: {sequence_name}")
+        else:
+            factory = unreal.LevelSequenceFactoryNew()
+            sequence = unreal.AssetToolsHelpers.get_asset_tools().create_asset(
+                sequence_name, sequence_path, unreal.LevelSequence, factory
+            )
+
+            if sequence:
+                self._created_sequences[panel_index] = full_path
+                sequence.set_display_rate(unreal.FrameRate(30, 1))
+                sequence.set_playback_start(0)
+                sequence.set_playback_end(90)
+                unreal.log(f"Created sequence: {sequence_name}")
+            else:
+                unreal.log_error("Failed to create sequence!")
+                return {}
+
+        return {'asset': sequence, 'path': full_path, 'name': sequence_name}
+
+    def _prepare_sequences(self, panel_indices: range) -> Dict[int, Dict[str, Any]]:
+        """
+        Load or create the sequence asset of every panel in a batch up front.
+        
+        Args:
+            panel_indices: Panel indices of the batch.
+        
+        Returns:
+            Dict mapping panel index to sequence data; failed panels are left
+            out so _create_sequence retries them individually.
+        """
+        pool = {}
+
+        try:
+            sequence_path = self._sequence_directory()
+            for panel_index in panel_indices:
+                sequence_data = self._load_or_create_sequence(panel_index, sequence_path)
+                if sequence_data:
+                    pool[panel_index] = sequence_data
+        except Exception as e:
+            unreal.log_error(f"Exception preparing sequences: {e}")
+            unreal.log_error(traceback.format_exc())
+
+        return pool
+
     def _create_sequence(self, panel_index: int, analysis: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create Level Sequence for the scene.
         
+        Uses the asset pooled by batch_build_scenes when available.
+        
         Args:
             panel_index: Panel index for naming.
             analysis: Panel analysis for context.
@@ -278,51 +644,25 @@ class SceneBuilder:
         sequence_data = {}
 
         try:
-            sequence_name = f"Panel_{panel_index:03d}_Sequence"
-            unreal.log(f"Creating sequence: {sequence_name}")
-
-            sequence_path = f"/Game/StoryboardSequences"
-            if self.show_name:
-                sequence_path = f"/Game/StoryboardSequences/{self.show_name}"
-
-            if not unreal.EditorAssetLibrary.does_directory_exist(sequence_path):
-                unreal.EditorAssetLibrary.make_directory(sequence_path)
-
-            full_path = f"{sequence_path}/{sequence_name}"
-
-            if unreal.EditorAssetLibrary.does_asset_exist(full_path):
-                sequence = unreal.EditorAssetLibrary.load_asset(full_path)
-                unreal.log(f"Using existing sequence: {sequence_name}")
+            pooled = self._sequence_pool.get(panel_index)
+            if pooled:
+                sequence_data = dict(pooled)
             else:
-                factory = unreal.LevelSequenceFactoryNew()
-                sequence = unreal.AssetToolsHelpers.get_asset_tools().create_asset(
-                    sequence_name, sequence_path, unreal.LevelSequence, factory
-                )
-
-                if sequence:
-                    sequence.set_display_rate(unreal.FrameRate(30, 1))
-                    sequence.set_playback_start(0)
-                    sequence.set_playback_end(90)
-                    unreal.log(f"Created sequence: {sequence_name}")
-                else:
-                    unreal.log_error("Failed to create sequence!")
+                unreal.log(f"Creating sequence: Panel_{panel_index:03d}_Sequence")
+                sequence_data = self._load_or_create_sequence(panel_index, self._sequence_directory())
+                if not sequence_data:
                     return sequence_data
 
-            sequence_data['asset'] = sequence
-            sequence_data['path'] = full_path
-            sequence_data['name'] = sequence_name
-
-            self.last_sequence_path = full_path
-            self.sequence_path = full_path
+            self.last_sequence_path = sequence_data['path']
+            self.sequence_path = sequence_data['path']
 
         except Exception as e:
             unreal.log_error(f"Exception in sequence creation: {e}")
-            import traceback
             unreal.log_error(traceback.format_exc())
 
         return sequence_data
 
-    def _spawn_characters(self, analysis: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _spawn_characters(self, analysis: Dict[str, Any]) -> List[ActorConfig]:
         """
         Prepare character spawn configurations.
         
@@ -333,61 +673,64 @@ class SceneBuilder:
             analysis: Panel analysis containing 'characters' list.
         
         Returns:
-            List of character config dicts with 'type', 'name', 'position', etc.
+            List of ActorConfig records with type, name, position, etc.
         """
-        character_configs = []
         character_names = analysis.get('characters', [])
         error_collector = OperationErrorCollector("Character Spawning")
 
         if not character_names:
             unreal.log("No characters to spawn")
-            return character_configs
+            return []
 
-        asset_paths = self._get_asset_paths_from_library()
+        char_paths = self._resolve_asset_paths(character_names, 'characters')
         location_type = analysis.get('location_type', 'outdoor')
         props_list = analysis.get('props', [])
         num_chars = len(character_names)
+        # One slot per name, every branch below fills its own index
+        character_configs: List[ActorConfig] = [None] * num_chars
 
         unreal.log(f"Positioning {num_chars} character(s) for {location_type} scene")
+        # Per-character lines only at DEBUG; the error collector summary always logs
+        verbose = logger.get_level() <= LogLevel.DEBUG
 
         for i, char_name in enumerate(character_names):
             try:
-                unreal.log(f"Preparing character config: {char_name}")
-
-                char_path = self._find_asset_path(char_name, asset_paths, 'characters')
+                char_path = char_paths[i]
                 position = self._calculate_character_position(i, num_chars, location_type, props_list)
                 
-                unreal.log(f"Position: X={position.x:.0f}, Y={position.y:.0f}, Z={position.z:.0f}")
+                if verbose:
+                    unreal.log(f"Preparing character config: {char_name}")
+                    unreal.log(f"Position: X={position.x:.0f}, Y={position.y:.0f}, Z={position.z:.0f}")
 
                 if char_path:
-                    if not unreal.EditorAssetLibrary.does_asset_exist(char_path):
+                    if not self._asset_exists(char_path):
                         error_collector.add_error(char_name, f"Asset does not exist: {char_path}")
-                        character_configs.append(self._create_placeholder_config(char_name, position))
+                        character_configs[i] = self._create_placeholder_config(char_name, position)
                         continue
 
-                    character_configs.append({
-                        'type': 'spawnable',
-                        'asset_path': char_path,
-                        'name': char_name,
-                        'position': position,
-                        'rotation': unreal.Rotator(pitch=0, yaw=0, roll=0),
-                        'is_placeholder': False
-                    })
-                    unreal.log(f"Config created: {char_name}")
+                    character_configs[i] = ActorConfig(
+                        type='spawnable',
+                        name=char_name,
+                        position=position,
+                        rotation=_ZERO_ROT,
+                        asset_path=char_path
+                    )
+                    if verbose:
+                        unreal.log(f"Config created: {char_name}")
                 else:
                     error_collector.add_warning(char_name, "Not found in asset library")
-                    character_configs.append(self._create_placeholder_config(char_name, position))
+                    character_configs[i] = self._create_placeholder_config(char_name, position)
 
             except Exception as e:
                 error_collector.add_error(char_name, str(e))
-                character_configs.append(self._create_placeholder_config(
-                    char_name, unreal.Vector(0, len(character_configs) * 100, 0)
-                ))
+                character_configs[i] = self._create_placeholder_config(
+                    char_name, unreal.Vector(0, i * 100, 0)
+                )
 
         error_collector.log_summary()
         return character_configs
 
-    def _spawn_props(self, analysis: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _spawn_props(self, analysis: Dict[str, Any]) -> List[ActorConfig]:
         """
         Prepare prop spawn configurations.
         
@@ -397,46 +740,48 @@ class SceneBuilder:
             analysis: Panel analysis containing 'props' or 'objects' list.
         
         Returns:
-            List of prop config dicts with 'type', 'name', 'position', etc.
+            List of ActorConfig records with type, name, position, etc.
         """
-        prop_configs = []
         prop_names = analysis.get('props', []) or analysis.get('objects', [])
         error_collector = OperationErrorCollector("Prop Spawning")
 
         if not prop_names:
             unreal.log("No props to spawn")
-            return prop_configs
+            return []
 
-        asset_paths = self._get_asset_paths_from_library()
+        prop_paths = self._resolve_asset_paths(prop_names, 'props')
+        prop_configs: List[ActorConfig] = [None] * len(prop_names)
+        verbose = logger.get_level() <= LogLevel.DEBUG
 
         for i, prop_name in enumerate(prop_names):
             try:
-                unreal.log(f"Preparing prop config: {prop_name}")
+                if verbose:
+                    unreal.log(f"Preparing prop config: {prop_name}")
 
-                prop_path = self._find_asset_path(prop_name, asset_paths, 'props')
-                position = unreal.Vector(0, 0, 0)  # AI positioning handles placement
+                prop_path = prop_paths[i]
+                position = _ZERO_VEC  # AI positioning handles placement
 
                 if prop_path:
-                    if not unreal.EditorAssetLibrary.does_asset_exist(prop_path):
+                    if not self._asset_exists(prop_path):
                         error_collector.add_error(prop_name, f"Asset does not exist: {prop_path}")
-                        prop_configs.append(self._create_placeholder_config(prop_name, position))
+                        prop_configs[i] = self._create_placeholder_config(prop_name, position)
                         continue
 
-                    prop_configs.append({
-                        'type': 'spawnable',
-                        'asset_path': prop_path,
-                        'name': prop_name,
-                        'position': position,
-                        'is_placeholder': False
-                    })
-                    unreal.log(f"Config created: {prop_name}")
+                    prop_configs[i] = ActorConfig(
+                        type='spawnable',
+                        name=prop_name,
+                        position=position,
+                        asset_path=prop_path
+                    )
+                    if verbose:
+                        unreal.log(f"Config created: {prop_name}")
                 else:
                     error_collector.add_warning(prop_name, "Not found in asset library")
-                    prop_configs.append(self._create_placeholder_config(prop_name, position))
+                    prop_configs[i] = self._create_placeholder_config(prop_name, position)
 
             except Exception as e:
                 error_collector.add_error(prop_name, str(e))
-                prop_configs.append(self._create_placeholder_config(prop_name, unreal.Vector(0, 0, 0)))
+                prop_configs[i] = self._create_placeholder_config(prop_name, _ZERO_VEC)
 
         error_collector.log_summary()
         return prop_configs
@@ -455,43 +800,16 @@ class SceneBuilder:
         Returns:
             List of light config dicts for spawnable creation.
         """
-        light_configs = []
-        mood = analysis.get('mood', 'neutral')
+        base_intensity = _MOOD_BASE.get(analysis.get('mood', 'neutral'), _DEFAULT_MOOD_BASE)
 
-        # Base intensity adjusted by mood
-        base_intensity = 2.0
-        if mood == 'dark':
-            base_intensity = 1.0
-        elif mood == 'bright':
-            base_intensity = 3.0
-
-        # Three-point lighting setup
-        light_configs.append({
-            'type': 'spawnable',
-            'class': unreal.PointLight,
-            'name': 'Key Light',
-            'position': unreal.Vector(-300, -200, 400),
-            'intensity': base_intensity * 1000,
-            'color': unreal.LinearColor(r=1.0, g=1.0, b=1.0)
-        })
-
-        light_configs.append({
+        light_configs = [{
             'type': 'spawnable',
-            'class': unreal.PointLight,
-            'name': 'Fill Light',
-            'position': unreal.Vector(-300, 200, 350),
-            'intensity': base_intensity * 500,
-            'color': unreal.LinearColor(r=1.0, g=1.0, b=1.0)
-        })
-
-        light_configs.append({
-            'type': 'spawnable',
-            'class': unreal.PointLight,
-            'name': 'Rim Light',
-            'position': unreal.Vector(400, 0, 300),
-            'intensity': base_intensity * 300,
-            'color': unreal.LinearColor(r=1.0, g=1.0, b=1.0)
-        })
+            'class': _POINT_LIGHT,
+            'name': name,
+            'position': position,
+            'intensity': base_intensity * fraction,
+            'color': _WHITE
+        } for name, position, fraction in _LIGHT_SPEC]
 
         unreal.log(f"Prepared {len(light_configs)} light configs")
         return light_configs
@@ -508,27 +826,21 @@ class SceneBuilder:
         """
         shot_type = analysis.get('shot_type', 'medium')
 
-        distance_map = {
-            'close': 150,
-            'medium': 300,
-            'wide': 600,
-            'extreme_wide': 1000
-        }
+        shot = _SHOT_TABLE.get(shot_type)
+        if shot:
+            distance, focal_length = shot
+        else:
+            # Unlisted shot types: default distance, lens picked by keyword
+            distance = 300
+            focal_length = 85.0 if 'close' in shot_type else 24.0 if 'wide' in shot_type else 50.0
 
-        distance = distance_map.get(shot_type, 300)
         camera_pos = unreal.Vector(-distance, 0, 180)
 
-        focal_length = 50.0
-        if 'close' in shot_type:
-            focal_length = 85.0
-        elif 'wide' in shot_type:
-            focal_length = 24.0
-
         camera_config = {
             'type': 'spawnable',
-            'class': unreal.CineCameraActor,
+            'class': _CINE_CAMERA,
             'position': camera_pos,
-            'rotation': unreal.Rotator(0, 0, 0),
+            'rotation': _ZERO_ROT,
             'label': f"Hero_StoryboardCamera_Shot_{shot_type}",
             'shot_type': shot_type,
             'focal_length': focal_length
@@ -570,19 +882,16 @@ class SceneBuilder:
         """
         Clear previously generated storyboard actors from the level.
         
-        Removes all actors tagged with 'StoryboardGenerated'.
+        Removes all actors tagged with 'StoryboardGenerated'. The tag filter
+        runs engine-side and the matches are destroyed in a single call.
         """
-        all_actors = unreal.EditorLevelLibrary.get_all_level_actors()
-        cleared_count = 0
-
-        for actor in all_actors:
-            if actor and hasattr(actor, 'tags'):
-                if 'StoryboardGenerated' in actor.tags:
-                    unreal.EditorLevelLibrary.destroy_actor(actor)
-                    cleared_count += 1
+        world = self.world or unreal.EditorLevelLibrary.get_editor_world()
+        tagged_actors = unreal.GameplayStatics.get_all_actors_with_tag(world, 'StoryboardGenerated')
 
-        if cleared_count > 0:
-            unreal.log(f"Cleared {cleared_count} previous storyboard actors")
+        if tagged_actors:
+            actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+            actor_subsystem.destroy_actors(tagged_actors)
+            unreal.log(f"Cleared {len(tagged_actors)} previous storyboard actors")
 
     def _calculate_character_position(self, char_index: int, num_chars: int, 
                                        location_type: str, props_list: List[str]) -> unreal.Vector:
@@ -607,6 +916,9 @@ class SceneBuilder:
         """
         Load asset paths from show's asset library.
         
+        The parsed library is cached and only re-read when the file's
+        modification time changes.
+        
         Returns:
             Asset library dict or None if unavailable.
         """
@@ -614,20 +926,85 @@ class SceneBuilder:
             return None
 
         try:
-            from core.utils import get_shows_manager
-            import json
+            library_path = get_show_asset_library_path(self.show_name)
+
+            try:
+                mtime = library_path.stat().st_mtime_ns
+            except FileNotFoundError:
+                self._library_cache = None
+                return None
 
-            shows_manager = get_shows_manager()
-            library_path = shows_manager.shows_root / self.show_name / 'asset_library.json'
+            if self._library_cache and self._library_cache[0] == mtime:
+                return self._library_cache[1]
 
-            if library_path.exists():
-                with open(library_path, 'r') as f:
-                    return json.load(f)
+            with open(library_path, 'r') as f:
+                library = json.load(f)
+            self._library_cache = (mtime, library, self._build_library_index(library))
+            self._match_cache.clear()
+            return library
         except Exception as e:
             unreal.log_error(f"Failed to load asset library: {e}")
 
         return None
 
+    @staticmethod
+    def _build_library_index(library: Dict[str, Any]) -> Dict[str, Dict[str, Tuple[str, str]]]:
+        """
+        Index asset library entries by lowercase name.
+        
+        Args:
+            library: Loaded asset library.
+        
+        Returns:
+            {category: {lowercase_name: (library_name, asset_path)}} in library order.
+        """
+        index = {}
+        for category, entries in library.items():
+            if isinstance(entries, dict):
+                index[category] = {
+                    lib_name.lower(): (lib_name, info.get('asset_path', ''))
+                    for lib_name, info in entries.items()
+                }
+        return index
+
+    def _resolve_asset_paths(self, names: List[str], category: str) -> List[Optional[str]]:
+        """
+        Resolve library asset paths for a list of names in one pass.
+        
+        Pure-Python prepass run before any config is built. Results are
+        memoized per name until the asset library file changes, so repeat
+        characters/props across panels skip matching entirely.
+        
+        Args:
+            names: Asset names to resolve.
+            category: Category to search ('characters', 'props').
+        
+        Returns:
+            Asset path (or None) for each name, in order.
+        """
+        asset_paths = self._get_asset_paths_from_library()
+        memoize = asset_paths is not None and self._library_cache is not None \
+            and asset_paths is self._library_cache[1]
+        resolved = []
+
+        for name in names:
+            key = (category, name)
+            if memoize and key in self._match_cache:
+                resolved.append(self._match_cache[key])
+                continue
+
+            try:
+                path = self._find_asset_path(name, asset_paths, category)
+            except Exception as e:
+                unreal.log_error(f"Failed to match '{name}' in {category}: {e}")
+                path = None
+
+            if memoize:
+                self._match_cache[key] = path
+            resolved.append(path)
+
+        return resolved
+
     def _find_asset_path(self, name: str, asset_paths: Optional[Dict], category: str) -> Optional[str]:
         """
         Find asset path by name in library.
@@ -647,15 +1024,26 @@ class SceneBuilder:
         if name in asset_paths[category]:
             return asset_paths[category][name].get('asset_path', '')
 
+        if self._library_cache and asset_paths is self._library_cache[1]:
+            category_index = self._library_cache[2].get(category, {})
+        else:
+            category_index = self._build_library_index({category: asset_paths[category]})[category]
+
+        # Case-insensitive exact match
+        key = name.lower()
+        entry = category_index.get(key)
+        if entry:
+            return entry[1]
+
         # Partial match
-        for lib_name, info in asset_paths[category].items():
-            if name.lower() in lib_name.lower() or lib_name.lower() in name.lower():
+        for lib_key, (lib_name, path) in category_index.items():
+            if key in lib_key or lib_key in key:
                 unreal.log(f"Found partial match '{lib_name}'")
-                return info.get('asset_path', '')
+                return path
 
         return None
 
-    def _create_placeholder_config(self, name: str, position: unreal.Vector) -> Dict[str, Any]:
+    def _create_placeholder_config(self, name: str, position: unreal.Vector) -> ActorConfig:
         """
         Create placeholder config for missing assets.
         
@@ -664,63 +1052,62 @@ class SceneBuilder:
             position: Spawn position.
         
         Returns:
-            Placeholder config dict.
+            Placeholder ActorConfig.
         """
-        return {
-            'type': 'spawnable_placeholder',
-            'name': name,
-            'position': position,
-            'is_placeholder': True
-        }
+        return ActorConfig(
+            type='spawnable_placeholder',
+            name=name,
+            position=position,
+            is_placeholder=True
+        )
 
     def _create_spawnable_from_config(self, sequence: unreal.LevelSequence, 
-                                       config: Dict[str, Any], actor_type: str) -> Optional[Any]:
+                                       config: ActorConfig, actor_type: str,
+                                       transforms: Optional[List[Tuple[Any, unreal.Vector, unreal.Rotator]]] = None) -> Optional[Any]:
         """
         Create spawnable actor in sequence from config.
         
         Args:
             sequence: Target Level Sequence.
-            config: Actor configuration dict.
+            config: Character or prop spawn config.
             actor_type: Type hint ('character' or 'prop').
+            transforms: Optional list collecting (spawnable, position, rotation)
+                       for _apply_spawnable_transforms instead of keying now.
         
         Returns:
             Spawnable binding or None on failure.
         """
         try:
-            name = config.get('name', 'Actor')
-            position = config.get('position', unreal.Vector(0, 0, 0))
-            rotation = config.get('rotation', unreal.Rotator(0, 0, 0))
-            is_placeholder = config.get('is_placeholder', False)
-
-            if is_placeholder:
-                unreal.log(f"Creating placeholder spawnable: {name}")
-                spawnable = sequence.add_spawnable_from_class(unreal.StaticMeshActor)
+            name = config.name
+            position = config.position
+            rotation = _ZERO_ROT if config.rotation is None else config.rotation
+
+            if config.is_placeholder:
+                spawnable = sequence.add_spawnable_from_class(_STATIC_MESH_ACTOR)
                 if spawnable:
                     object_template = spawnable.get_object_template()
                     if object_template:
                         static_mesh_component = object_template.static_mesh_component
                         if static_mesh_component:
-                            cube = unreal.EditorAssetLibrary.load_asset('/Engine/BasicShapes/Cube')
+                            cube = self._placeholder_cube
                             if cube:
                                 static_mesh_component.set_static_mesh(cube)
                         object_template.set_actor_scale3d(unreal.Vector(0.5, 0.5, 2.0))
 
                     spawnable.set_display_name(f"{name}_Placeholder")
-                    self._set_spawnable_transform(spawnable, position, rotation)
+                    self._queue_spawnable_transform(spawnable, position, rotation, transforms)
                     return spawnable
             else:
-                asset_path = config.get('asset_path', '')
+                asset_path = config.asset_path
                 if not asset_path:
                     unreal.log_error(f"No asset path for {name}")
                     return None
 
-                if not unreal.EditorAssetLibrary.does_asset_exist(asset_path):
-                    unreal.log_error(f"Asset doesn't exist: {asset_path}")
-                    return None
-
+                # Existence was already checked when the config was built; load_asset
+                # returns None for a missing asset, so no separate registry check
                 asset = unreal.EditorAssetLibrary.load_asset(asset_path)
                 if not asset:
-                    unreal.log_error(f"Failed to load asset: {asset_path}")
+                    unreal.log_error(f"Asset doesn't exist or failed to load: {asset_path}")
                     return None
 
                 spawnable = None
@@ -728,7 +1115,11 @@ class SceneBuilder:
                 # Try as blueprint
                 if 'BP_' in asset_path or 'blueprint' in asset_path.lower():
                     try:
-                        blueprint_class = unreal.EditorAssetLibrary.load_blueprint_class(asset_path)
+                        blueprint_class = self._bp_class_cache.get(asset_path)
+                        if blueprint_class is None:
+                            blueprint_class = unreal.EditorAssetLibrary.load_blueprint_class(asset_path)
+                            if blueprint_class:
+                                self._bp_class_cache[asset_path] = blueprint_class
                         if blueprint_class:
                             spawnable = sequence.add_spawnable_from_class(blueprint_class)
                     except:
@@ -743,7 +1134,7 @@ class SceneBuilder:
 
                 if spawnable:
                     spawnable.set_display_name(name)
-                    self._set_spawnable_transform(spawnable, position, rotation)
+                    self._queue_spawnable_transform(spawnable, position, rotation, transforms)
                     return spawnable
                 else:
                     unreal.log_error(f"Failed to create spawnable for: {name}")
@@ -751,12 +1142,40 @@ class SceneBuilder:
 
         except Exception as e:
             unreal.log_error(f"Error creating spawnable: {e}")
-            import traceback
             unreal.log_error(traceback.format_exc())
             return None
 
+    def _queue_spawnable_transform(self, spawnable: Any, position: unreal.Vector, rotation: unreal.Rotator,
+                                   transforms: Optional[List[Tuple[Any, unreal.Vector, unreal.Rotator]]]) -> None:
+        """
+        Key a spawnable's transform now, or defer it to a batch when collecting.
+        
+        Args:
+            spawnable: Spawnable binding to configure.
+            position: Initial position.
+            rotation: Initial rotation.
+            transforms: Batch list from _add_actors_to_sequence, or None.
+        """
+        if transforms is None:
+            self._set_spawnable_transform(spawnable, position, rotation)
+        else:
+            transforms.append((spawnable, position, rotation))
+
+    def _apply_spawnable_transforms(self, transforms: List[Tuple[Any, unreal.Vector, unreal.Rotator]]) -> None:
+        """
+        Key the transforms collected while creating a sequence's spawnables.
+        
+        Runs once per sequence after every binding exists, so track setup is
+        done in one pass instead of interleaved with spawnable creation.
+        
+        Args:
+            transforms: (spawnable, position, rotation) tuples.
+        """
+        for spawnable, position, rotation in transforms:
+            self._set_spawnable_transform(spawnable, position, rotation)
+
     def _set_spawnable_transform(self, spawnable: Any, position: unreal.Vector, 
-                                  rotation: unreal.Rotator) -> None:
+                                  rotation: unreal.Rotator, end_frame: int = 90) -> Optional[Any]:
         """
         Set transform keyframes for a spawnable actor.
         
@@ -764,46 +1183,88 @@ class SceneBuilder:
             spawnable: Spawnable binding to configure.
             position: Initial position.
             rotation: Initial rotation.
+            end_frame: Last frame of the transform section (default 90).
+        
+        Returns:
+            The transform section, or None if it could not be created.
         """
+        transform_section = None
         try:
-            transform_track = spawnable.add_track(unreal.MovieScene3DTransformTrack)
+            transform_track = spawnable.add_track(_TRANSFORM_TRACK)
             if transform_track:
                 transform_section = transform_track.add_section()
                 if transform_section:
                     transform_section.set_start_frame_bounded(True)
                     transform_section.set_end_frame_bounded(True)
                     transform_section.set_start_frame(0)
-                    transform_section.set_end_frame(90)
-
-                    channels = transform_section.get_all_channels()
-                    if len(channels) >= 6:
-                        channels[0].add_key(unreal.FrameNumber(0), position.x)
-                        channels[1].add_key(unreal.FrameNumber(0), position.y)
-                        channels[2].add_key(unreal.FrameNumber(0), position.z)
-                        channels[3].add_key(unreal.FrameNumber(0), rotation.roll)
-                        channels[4].add_key(unreal.FrameNumber(0), rotation.pitch)
-                        channels[5].add_key(unreal.FrameNumber(0), rotation.yaw)
+                    transform_section.set_end_frame(end_frame)
+
+                    # Fixed layout: location x/y/z, rotation roll/pitch/yaw, then scale
+                    try:
+                        tx, ty, tz, rr, rp, ry, *_ = transform_section.get_all_channels()
+                    except ValueError:
+                        unreal.log_warning("Transform section has fewer than 6 channels")
+                        return transform_section
+
+                    tx.add_key(_FRAME0, position.x)
+                    ty.add_key(_FRAME0, position.y)
+                    tz.add_key(_FRAME0, position.z)
+                    rr.add_key(_FRAME0, rotation.roll)
+                    rp.add_key(_FRAME0, rotation.pitch)
+                    ry.add_key(_FRAME0, rotation.yaw)
         except Exception as e:
             unreal.log_error(f"Failed to set spawnable transform: {e}")
 
-    def _create_spawnable_actor(self, sequence: unreal.LevelSequence, 
-                                 config: Dict[str, Any]) -> Optional[Any]:
+        return transform_section
+
+    def _resolve_spawn_config(self, config: Dict[str, Any]) -> SpawnSpec:
+        """
+        Resolve a camera or light config into a SpawnSpec.
+        
+        Pure config work with no sequence access, run for every config
+        before any spawnable is created.
+        
+        Args:
+            config: Actor configuration with 'class', 'position', etc.
+        
+        Returns:
+            SpawnSpec with defaults filled in.
+        """
+        actor_class = config['class']
+        if actor_class == _CINE_CAMERA:
+            display_name = config.get('label', 'Camera')
+        elif actor_class == _POINT_LIGHT:
+            display_name = config.get('name', 'Light')
+        else:
+            display_name = None
+
+        return SpawnSpec(
+            actor_class=actor_class,
+            name=config.get('name', 'actor'),
+            display_name=display_name,
+            position=config.get('position') or _ZERO_VEC,
+            rotation=config.get('rotation') or _ZERO_ROT,
+            focal_length=config.get('focal_length', 50.0),
+            intensity=config.get('intensity', 5000.0),
+            color=config.get('color') or _WHITE
+        )
+
+    def _apply_spawn_config(self, sequence: unreal.LevelSequence, spec: SpawnSpec) -> Optional[Any]:
         """
         Create spawnable actor (camera or light) in sequence.
         
         Args:
             sequence: Target Level Sequence.
-            config: Actor configuration with 'class', 'position', etc.
+            spec: Resolved config from _resolve_spawn_config.
         
         Returns:
             Spawnable binding or None on failure.
         """
         try:
-            actor_class = config['class']
-            spawnable = sequence.add_spawnable_from_class(actor_class)
+            spawnable = sequence.add_spawnable_from_class(spec.actor_class)
             
             if not spawnable:
-                unreal.log_error(f"Failed to create spawnable for {config.get('name', 'actor')}")
+                unreal.log_error(f"Failed to create spawnable for {spec.name}")
                 return None
 
             object_template = spawnable.get_object_template()
@@ -812,138 +1273,105 @@ class SceneBuilder:
                 return None
 
             # Set transform
-            transform_track = spawnable.add_track(unreal.MovieScene3DTransformTrack)
-            if transform_track:
-                transform_section = transform_track.add_section()
-                if transform_section:
-                    transform_section.set_start_frame_bounded(True)
-                    transform_section.set_end_frame_bounded(True)
-                    transform_section.set_start_frame(0)
-                    transform_section.set_end_frame(90)
-
-                    position = config.get('position', unreal.Vector(0, 0, 0))
-                    rotation = config.get('rotation', unreal.Rotator(0, 0, 0))
-
-                    channels = transform_section.get_all_channels()
-                    if len(channels) >= 6:
-                        channels[0].add_key(unreal.FrameNumber(0), position.x)
-                        channels[1].add_key(unreal.FrameNumber(0), position.y)
-                        channels[2].add_key(unreal.FrameNumber(0), position.z)
-                        channels[3].add_key(unreal.FrameNumber(0), rotation.roll)
-                        channels[4].add_key(unreal.FrameNumber(0), rotation.pitch)
-                        channels[5].add_key(unreal.FrameNumber(0), rotation.yaw)
+            self._set_spawnable_transform(spawnable, spec.position, spec.rotation)
 
             # Configure by type
-            if actor_class == unreal.CineCameraActor:
-                camera_component = object_template.get_cine_camera_component()
-                if camera_component:
-                    camera_component.filmback.sensor_width = 36.0
-                    camera_component.filmback.sensor_height = 24.0
-                    camera_component.current_focal_length = config.get('focal_length', 50.0)
-                    camera_component.current_aperture = 2.8
-
-                    focus_settings = camera_component.focus_settings
-                    focus_settings.focus_method = unreal.CameraFocusMethod.DISABLE
-                    camera_component.set_editor_property('focus_settings', focus_settings)
-
-                    post_process = camera_component.post_process_settings
-                    post_process.override_depth_of_field_fstop = True
-                    post_process.depth_of_field_fstop = 32.0
-                    post_process.override_depth_of_field_focal_distance = True
-                    post_process.depth_of_field_focal_distance = 100000.0
-                    camera_component.set_editor_property('post_process_settings', post_process)
-
-                spawnable.set_display_name(config.get('label', 'Camera'))
-
-            elif actor_class == unreal.PointLight:
-                light_component = object_template.point_light_component
-                if light_component:
-                    light_component.set_intensity(config.get('intensity', 5000.0))
-                    light_component.set_light_color(config.get('color', unreal.LinearColor(1.0, 1.0, 1.0)))
-
-                spawnable.set_display_name(config.get('name', 'Light'))
+            configurator = _SPAWNABLE_CONFIGURATORS.get(spec.actor_class)
+            if configurator:
+                configurator(object_template, spec)
+
+            if spec.display_name is not None:
+                spawnable.set_display_name(spec.display_name)
 
             return spawnable
 
         except Exception as e:
             unreal.log_error(f"Error creating spawnable: {e}")
-            import traceback
             unreal.log_error(traceback.format_exc())
             return None
 
-    def _add_actors_to_sequence(self, scene_data: Dict[str, Any]) -> None:
+    def _add_actors_to_sequence(self, scene_data: Dict[str, Any], defer_save: bool = False) -> None:
         """
         Add all actors to the sequence as spawnables.
         
         Creates camera, lights, characters, and props as spawnable actors
-        within the Level Sequence.
+        within the Level Sequence. The sequence is populated as an asset and
+        only opened in Sequencer once that succeeded, so the editor refreshes
+        once. Errors propagate so _run_step can fail the panel.
         
         Args:
             scene_data: Complete scene data with all configs.
+            defer_save: Skip saving; the batch saves successful sequences at the end.
+        
+        Raises:
+            RuntimeError: If the sequence asset or its movie scene is missing.
         """
         sequence = scene_data['sequence'].get('asset')
         sequence_path = scene_data['sequence'].get('path')
 
         if not sequence:
-            unreal.log_error("No sequence asset found!")
-            return
+            raise RuntimeError("No sequence asset found")
 
-        unreal.log(f"Opening sequence: {sequence_path}")
-        unreal.LevelSequenceEditorBlueprintLibrary.open_level_sequence(sequence)
         unreal.log("\nADDING ACTORS TO SEQUENCE")
 
-        try:
-            movie_scene = sequence.get_movie_scene()
-            if not movie_scene:
-                unreal.log_warning("No movie scene found")
-                return
+        movie_scene = sequence.get_movie_scene()
+        if not movie_scene:
+            raise RuntimeError("No movie scene found")
+
+        # One creation plan in build order: camera, lights, characters, props.
+        # Camera and light configs are resolved here, before any spawnable exists
+        actors_to_add: List[Tuple[str, Any]] = []
+        camera_config = scene_data.get('camera')
+        if camera_config and isinstance(camera_config, dict) and camera_config.get('type') == 'spawnable':
+            actors_to_add.append(('camera', self._resolve_spawn_config(camera_config)))
+        actors_to_add.extend(
+            ('light', self._resolve_spawn_config(config)) for config in scene_data.get('lights', [])
+            if isinstance(config, dict) and config.get('type') == 'spawnable'
+        )
+        actors_to_add.extend(
+            ('character', config) for config in scene_data.get('characters', [])
+            if isinstance(config, ActorConfig)
+        )
+        actors_to_add.extend(
+            ('prop', config) for config in scene_data.get('props', [])
+            if isinstance(config, ActorConfig)
+        )
+
+        spawned: Dict[str, List[Any]] = {'camera': [], 'light': [], 'character': [], 'prop': []}
+        # (spawnable, position, rotation) keyed in one pass after creation
+        transforms: List[Tuple[Any, unreal.Vector, unreal.Rotator]] = []
+
+        for kind, config in actors_to_add:
+            if kind == 'camera' or kind == 'light':
+                binding = self._apply_spawn_config(sequence, config)
+            else:
+                binding = self._create_spawnable_from_config(sequence, config, kind, transforms)
+            if binding:
+                spawned[kind].append(binding)
+
+        self._apply_spawnable_transforms(transforms)
+        spawned_camera = spawned['camera'][0] if spawned['camera'] else None
+
+        # Camera cuts
+        if spawned_camera:
+            self._setup_camera_cuts_spawnable(movie_scene, spawned_camera, sequence)
+
+        unreal.log(f"Sequence complete!")
+        unreal.log(f"Camera: {'Yes' if spawned_camera else 'No'}")
+        unreal.log(f"Lights: {len(spawned['light'])}")
+        unreal.log(f"Characters: {len(spawned['character'])}")
+        unreal.log(f"Props: {len(spawned['prop'])}")
+        placeholders = [config.name for kind, config in actors_to_add
+                        if isinstance(config, ActorConfig) and config.is_placeholder]
+        if placeholders:
+            unreal.log(f"Placeholders: {', '.join(placeholders)}")
 
-            spawned_camera = None
-            spawned_lights = []
-            spawned_characters = []
-            spawned_props = []
-
-            # Camera
-            camera_config = scene_data.get('camera')
-            if camera_config and isinstance(camera_config, dict) and camera_config.get('type') == 'spawnable':
-                unreal.log("Creating spawnable camera...")
-                spawned_camera = self._create_spawnable_actor(sequence, camera_config)
-
-            # Lights
-            for light_config in scene_data.get('lights', []):
-                if isinstance(light_config, dict) and light_config.get('type') == 'spawnable':
-                    spawned_light = self._create_spawnable_actor(sequence, light_config)
-                    if spawned_light:
-                        spawned_lights.append(spawned_light)
-
-            # Characters
-            for char_config in scene_data.get('characters', []):
-                if isinstance(char_config, dict):
-                    spawned = self._create_spawnable_from_config(sequence, char_config, 'character')
-                    if spawned:
-                        spawned_characters.append(spawned)
-
-            # Props
-            for prop_config in scene_data.get('props', []):
-                if isinstance(prop_config, dict):
-                    spawned = self._create_spawnable_from_config(sequence, prop_config, 'prop')
-                    if spawned:
-                        spawned_props.append(spawned)
-
-            # Camera cuts
-            if spawned_camera:
-                self._setup_camera_cuts_spawnable(movie_scene, spawned_camera, sequence)
-
-            unreal.log(f"Sequence complete!")
-            unreal.log(f"Camera: {'Yes' if spawned_camera else 'No'}")
-            unreal.log(f"Lights: {len(spawned_lights)}")
-            unreal.log(f"Characters: {len(spawned_characters)}")
-            unreal.log(f"Props: {len(spawned_props)}")
+        unreal.log(f"Opening sequence: {sequence_path}")
+        unreal.LevelSequenceEditorBlueprintLibrary.open_level_sequence(sequence)
+        unreal.LevelSequenceEditorBlueprintLibrary.refresh_current_level_sequence()
 
-        except Exception as e:
-            unreal.log_error(f"Error adding actors: {e}")
-            import traceback
-            unreal.log_error(traceback.format_exc())
+        if defer_save:
+            return
 
         # Save
         try:
@@ -965,23 +1393,15 @@ class SceneBuilder:
         try:
             unreal.log("Setting up Camera Cuts Track...")
 
-            existing_tracks = sequence.find_tracks_by_type(unreal.MovieSceneCameraCutTrack)
-
-            if existing_tracks and len(existing_tracks) > 0:
-                camera_cut_track = existing_tracks[0]
-            else:
-                camera_cut_track = sequence.add_track(unreal.MovieSceneCameraCutTrack)
+            # The cut track is a singleton: replace it rather than clearing its sections
+            for existing_track in sequence.find_tracks_by_type(_CUT_TRACK):
+                sequence.remove_track(existing_track)
 
+            camera_cut_track = movie_scene.add_track(_CUT_TRACK)
             if not camera_cut_track:
                 unreal.log_error("Failed to create camera cut track!")
                 return
 
-            # Clear existing sections
-            sections = camera_cut_track.get_sections()
-            if sections:
-                for section in sections:
-                    camera_cut_track.remove_section(section)
-
             camera_cut_section = camera_cut_track.add_section()
             if not camera_cut_section:
                 unreal.log_error("Failed to create camera cut section!")
@@ -1000,5 +1420,4 @@ class SceneBuilder:
 
         except Exception as e:
             unreal.log_error(f"Failed to setup camera cuts: {e}")
-            import traceback
             unreal.log_error(traceback.format_exc())
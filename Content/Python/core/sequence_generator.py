@@ -9,8 +9,15 @@ actor bindings, and master sequence assembly for multi-shot workflows.
 """
 
 import unreal
+from itertools import accumulate
 from typing import Optional, List, Dict, Any
 
+# Reflected class handles, resolved once instead of per call
+_LEVEL_SEQUENCE = unreal.LevelSequence
+_CUT_TRACK = unreal.MovieSceneCameraCutTrack
+_SUB_TRACK = unreal.MovieSceneSubTrack
+_LOCAL = unreal.MovieSceneObjectBindingSpace.LOCAL
+
 
 class SequenceGenerator:
     """
@@ -41,14 +48,22 @@ class SequenceGenerator:
             self.sequence_dir = f'/Game/StoryboardSequences/{show_name}/'
         else:
             self.sequence_dir = '/Game/StoryboardSequences/'
+
+        # Resolved once and reused for every shot this generator creates
+        self._asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
+        self._seq_factory = unreal.LevelSequenceFactoryNew()
+        self._editor_asset_lib = unreal.EditorAssetLibrary
+        self._dir_ensured = False
         unreal.log(f"SequenceGenerator initialized for show: {show_name or 'No show'}")
 
-    def create_sequence(self, scene_data: Dict[str, Any], duration: float = 3.0) -> Optional[unreal.LevelSequence]:
+    def create_sequence(self, scene_data: Dict[str, Any], duration: float = 3.0,
+                        defer_save: bool = False) -> Optional[unreal.LevelSequence]:
         """
         Create a Level Sequence for a scene.
         
         Creates or loads an existing sequence, sets up playback range,
-        and binds camera and actors from the scene data.
+        and binds camera and actors from the scene data. Binding actors opens
+        the sequence in Sequencer.
         
         Args:
             scene_data: Dictionary containing scene information with keys:
@@ -56,6 +71,7 @@ class SequenceGenerator:
                 - camera: Optional camera actor to bind
                 - actors: List of actors to bind to sequence
             duration: Sequence duration in seconds (default 3.0).
+            defer_save: Skip saving the shot; call flush() after the batch.
         
         Returns:
             Created or loaded LevelSequence asset, or None if creation fails.
@@ -77,20 +93,18 @@ class SequenceGenerator:
 
         unreal.log(f"Creating sequence: {sequence_name} for show: {self.show_name or 'No show'}")
 
-        # Ensure directory exists
-        if not unreal.EditorAssetLibrary.does_directory_exist(self.sequence_dir):
-            unreal.EditorAssetLibrary.make_directory(self.sequence_dir)
+        self._ensure_sequence_dir()
 
         # Load existing or create new
-        if unreal.EditorAssetLibrary.does_asset_exist(sequence_path):
-            sequence = unreal.EditorAssetLibrary.load_asset(sequence_path)
+        if self._editor_asset_lib.does_asset_exist(sequence_path):
+            sequence = self._editor_asset_lib.load_asset(sequence_path)
             unreal.log(f"Loaded existing sequence: {sequence_name}")
         else:
-            sequence = unreal.AssetToolsHelpers.get_asset_tools().create_asset(
+            sequence = self._asset_tools.create_asset(
                 asset_name=sequence_name,
                 package_path=self.sequence_dir,
-                asset_class=unreal.LevelSequence,
-                factory=unreal.LevelSequenceFactoryNew()
+                asset_class=_LEVEL_SEQUENCE,
+                factory=self._seq_factory
             )
 
             if not sequence:
@@ -113,19 +127,37 @@ class SequenceGenerator:
 
         # Bind camera
         if scene_data.get('camera'):
-            self.add_camera_to_sequence(sequence, scene_data['camera'], duration)
+            self.add_camera_to_sequence(sequence, scene_data['camera'], duration, movie_scene)
 
         # Bind actors
-        for actor in scene_data.get('actors', []):
-            self.add_actor_to_sequence(sequence, actor, duration)
+        self.add_actors_to_sequence(sequence, scene_data.get('actors', []))
 
         # Save
-        unreal.EditorAssetLibrary.save_asset(sequence_path)
+        if not defer_save:
+            self._editor_asset_lib.save_asset(sequence_path)
 
         unreal.log(f"Sequence created successfully: {sequence_name}")
         return sequence
 
-    def add_camera_to_sequence(self, sequence: unreal.LevelSequence, camera: unreal.Actor, duration: float) -> None:
+    def _ensure_sequence_dir(self) -> None:
+        """Create the sequence folder on first use; later calls skip the registry check."""
+        if self._dir_ensured:
+            return
+
+        if not self._editor_asset_lib.does_directory_exist(self.sequence_dir):
+            self._editor_asset_lib.make_directory(self.sequence_dir)
+        self._dir_ensured = True
+
+    def flush(self) -> None:
+        """
+        Save every dirty asset in the sequence folder in one pass.
+        
+        Pairs with create_sequence(defer_save=True) when building many shots.
+        """
+        self._editor_asset_lib.save_directory(self.sequence_dir, only_if_is_dirty=True, recursive=False)
+
+    def add_camera_to_sequence(self, sequence: unreal.LevelSequence, camera: unreal.Actor, duration: float,
+                               movie_scene: Optional[Any] = None) -> None:
         """
         Add camera to sequence with camera cut track.
         
@@ -136,6 +168,7 @@ class SequenceGenerator:
             sequence: Target Level Sequence to add camera to.
             camera: Camera actor to bind.
             duration: Duration for the camera cut section in seconds.
+            movie_scene: The sequence's movie scene if the caller already has it.
         """
         if not camera:
             return
@@ -144,13 +177,14 @@ class SequenceGenerator:
         camera_binding = sequence.add_possessable(camera)
 
         # Get movie scene
-        movie_scene = sequence.get_movie_scene()
+        if movie_scene is None:
+            movie_scene = sequence.get_movie_scene()
         if not movie_scene:
             unreal.log_error("Failed to get movie scene for camera cut track")
             return
 
         # Add camera cuts track
-        camera_cut_track = movie_scene.add_track(unreal.MovieSceneCameraCutTrack)
+        camera_cut_track = movie_scene.add_track(_CUT_TRACK)
 
         # Configure cut section
         camera_cut_section = camera_cut_track.add_section()
@@ -162,28 +196,58 @@ class SequenceGenerator:
         # Bind camera to cut track
         camera_binding_id = sequence.make_binding_id(
             camera_binding, 
-            unreal.MovieSceneObjectBindingSpace.LOCAL
+            _LOCAL
         )
         camera_cut_section.set_camera_binding_id(camera_binding_id)
 
         unreal.log("Camera added to sequence")
 
+    def add_actors_to_sequence(self, sequence: unreal.LevelSequence, actors: List[unreal.Actor]) -> List[Any]:
+        """
+        Add actors to sequence as possessables in one batch.
+        
+        Binds all actors through a single LevelSequenceEditorSubsystem.add_actors
+        call. That call works on the sequence open in Sequencer, so binding
+        opens the sequence in Sequencer (via LevelSequenceEditorBlueprintLibrary)
+        as a side effect if it is not already open. Falls back to per-actor
+        add_possessable, which leaves Sequencer alone, when the subsystem is
+        unavailable.
+        
+        Args:
+            sequence: Target Level Sequence to add actors to.
+            actors: Actors to bind; None entries are skipped.
+        
+        Returns:
+            Created bindings.
+        """
+        actors = [actor for actor in actors if actor]
+        if not actors:
+            return []
+
+        level_seq_subsystem = unreal.get_editor_subsystem(unreal.LevelSequenceEditorSubsystem)
+        if not level_seq_subsystem:
+            bindings = [sequence.add_possessable(actor) for actor in actors]
+        else:
+            if unreal.LevelSequenceEditorBlueprintLibrary.get_current_level_sequence() != sequence:
+                unreal.LevelSequenceEditorBlueprintLibrary.open_level_sequence(sequence)
+            bindings = level_seq_subsystem.add_actors(actors)
+
+        unreal.log(f"Added {len(bindings)} actors to sequence")
+        return bindings
+
     def add_actor_to_sequence(self, sequence: unreal.LevelSequence, actor: unreal.Actor, duration: float) -> None:
         """
         Add actor to sequence as possessable.
         
-        Binds the actor to the sequence for potential animation or transform tracks.
+        Single-actor form of add_actors_to_sequence, kept for existing callers.
+        Like it, this opens the sequence in Sequencer if it is not open yet.
         
         Args:
             sequence: Target Level Sequence to add actor to.
             actor: Actor to bind.
             duration: Sequence duration (reserved for future track setup).
         """
-        if not actor:
-            return
-
-        sequence.add_possessable(actor)
-        unreal.log(f"Actor {actor.get_name()} added to sequence")
+        self.add_actors_to_sequence(sequence, [actor])
 
     def create_master_sequence(self, sequences: List[unreal.LevelSequence]) -> Optional[unreal.LevelSequence]:
         """
@@ -216,19 +280,17 @@ class SequenceGenerator:
 
         unreal.log(f"Creating master sequence with {len(sequences)} shots")
 
-        # Ensure directory exists
-        if not unreal.EditorAssetLibrary.does_directory_exist(self.sequence_dir):
-            unreal.EditorAssetLibrary.make_directory(self.sequence_dir)
+        self._ensure_sequence_dir()
 
         # Load existing or create new
-        if unreal.EditorAssetLibrary.does_asset_exist(master_path):
-            master = unreal.EditorAssetLibrary.load_asset(master_path)
+        if self._editor_asset_lib.does_asset_exist(master_path):
+            master = self._editor_asset_lib.load_asset(master_path)
         else:
-            master = unreal.AssetToolsHelpers.get_asset_tools().create_asset(
+            master = self._asset_tools.create_asset(
                 asset_name=master_name,
                 package_path=self.sequence_dir,
-                asset_class=unreal.LevelSequence,
-                factory=unreal.LevelSequenceFactoryNew()
+                asset_class=_LEVEL_SEQUENCE,
+                factory=self._seq_factory
             )
 
         if not master:
@@ -242,39 +304,43 @@ class SequenceGenerator:
             return None
 
         # Add subsequence track
-        sub_track = movie_scene.add_track(unreal.MovieSceneSubTrack)
+        sub_track = movie_scene.add_track(_SUB_TRACK)
 
-        # Add each sequence
-        current_time = 0
-        for seq in sequences:
-            if not seq:
-                continue
+        # First pass: shot durations, then start/end frames from a running sum
+        shots = [seq for seq in sequences if seq]
+        durations = [self._seq_duration(seq) for seq in shots]
+        ends = list(accumulate(durations))
+        starts = [0] + ends[:-1]
 
-            # Create section for this sequence
+        # Second pass: one section per shot
+        for seq, start, end in zip(shots, starts, ends):
             section = sub_track.add_section()
             section.set_sequence(seq)
-
-            # Set timing
             section.set_start_frame_bounded(True)
-            section.set_start_frame(current_time)
-
-            # Get duration from sequence
-            seq_movie_scene = seq.get_movie_scene()
-            if seq_movie_scene:
-                playback_range = seq_movie_scene.get_playback_range()
-                duration = playback_range.get_end_frame() - playback_range.get_start_frame()
-            else:
-                duration = 90  # Default 3 seconds at 30fps
-
+            section.set_start_frame(start)
             section.set_end_frame_bounded(True)
-            section.set_end_frame(current_time + duration)
+            section.set_end_frame(end)
 
-            current_time += duration
+        # Save master along with any shots created with defer_save
+        self.flush()
 
-            unreal.log(f"Added subsequence: {seq.get_name()}")
+        unreal.log(f"Master sequence created: {master_name} ({len(shots)} subsequences)")
+        return master
 
-        # Save master
-        unreal.EditorAssetLibrary.save_asset(master_path)
+    @staticmethod
+    def _seq_duration(sequence: unreal.LevelSequence) -> int:
+        """
+        Get a sequence's playback length in frames.
+        
+        Args:
+            sequence: Shot sequence.
+        
+        Returns:
+            Playback range length, or 90 (3 seconds at 30fps) without a movie scene.
+        """
+        movie_scene = sequence.get_movie_scene()
+        if not movie_scene:
+            return 90
 
-        unreal.log(f"Master sequence created: {master_name}")
-        return master
+        playback_range = movie_scene.get_playback_range()
+        return playback_range.get_end_frame() - playback_range.get_start_frame()
@@ -6,11 +6,311 @@ Handles all settings: global, show, episode, and panel-level
 """
 
 import unreal
-import json
+import atexit
+import gzip
+import hashlib
 import os
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Optional, Set, Tuple
+
+from core.utils import dump_json, load_json
+
+
+@lru_cache(maxsize=256)
+def _split_path(path: str) -> Tuple[str, ...]:
+    """Split a dot-notation settings path"""
+    return tuple(path.split('.'))
+
+
+def _digest(data: bytes) -> bytes:
+    """Short content hash used to skip rewriting unchanged files"""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+# panel_settings.json payloads above this size are stored gzipped
+_PANEL_GZIP_THRESHOLD = 64 * 1024
+
+def _copy_json(value: Any) -> Any:
+    """Deep-copy JSON-shaped data (dicts, lists, scalars) without deepcopy's memo bookkeeping"""
+    if type(value) is dict:
+        return {key: _copy_json(item) for key, item in value.items()}
+    if type(value) is list:
+        return [_copy_json(item) for item in value]
+    return value
+
+
+# Default global settings, minus version and last_modified; copied on use
+_GLOBAL_DEFAULTS_TEMPLATE = {
+    'auto_save': True,
+    'auto_save_interval': 60,  # seconds
+    'auto_save_debounce_ms': 500,
+    'backup_enabled': True,
+    'max_backups': 10,
+    'backup_min_interval_sec': 300,
+    'durable_writes': False,  # fsync every save
+    'panel_cache_size': 1024,
+
+    # AI Settings
+    'ai': {
+        'provider': 'none',  # 'openai', 'claude', 'none'
+        'openai_api_key': '',
+        'claude_api_key': '',
+        'model': 'gpt-4-vision-preview',
+        'max_tokens': 500,
+        'temperature': 0.7,
+        'enable_caching': True,
+        'cache_duration': 86400  # 24 hours
+    },
+
+    # Ollama Settings (for local AI)
+    'ollama': {
+        'server_url': 'http://localhost:11434',
+        'auto_start': True,
+        'default_text_model': 'llama3.2',
+        'default_vision_model': 'llava',
+        'context_length': 4096,
+        'gpu_layers': 0,
+        'keep_loaded': False,
+        'parallel_requests': 1,
+        'request_timeout': 60,
+        'use_streaming': True
+    },
+
+    # AI Settings (general)
+    'ai_settings': {
+        'provider': 'Ollama (Local)',
+        'api_key': '',
+        'endpoint': '',
+        'text_model': 'llama3.2',
+        'vision_model': 'llava',
+        'temperature': 0.7,
+        'max_tokens': 2000,
+        'auto_analyze': True,
+        'batch_analysis': True,
+        'batch_size': 5,
+        'timeout': 30,
+        'retry_on_failure': True,
+        'max_retries': 3,
+        'use_optimized_prompts': True  # Enable 50-66% token reduction (Optimization #4)
+    },
+
+    # Default Panel Settings
+    'panel_defaults': {
+        'duration': 3.0,
+        'transition_duration': 0.5,
+        'shot_type': 'auto',
+        'camera_height': 160.0,
+        'camera_fov': 90.0,
+        'enable_auto_framing': True,
+        'enable_depth_of_field': False,
+        'enable_motion_blur': False
+    },
+
+    # Scene Generation Settings
+    'scene': {
+        'clear_before_build': True,
+        'build_location': [0, 0, 0],
+        'spacing_between_scenes': 2000,
+        'default_lighting': 'three_point',
+        'default_time_of_day': 'day',
+        'default_mood': 'neutral',
+        'use_hdri': False,
+        'hdri_path': '',
+        'enable_shadows': True,
+        'shadow_quality': 'medium'
+    },
+
+    # Sequence Settings
+    'sequence': {
+        'fps': 30,
+        'resolution': [1920, 1080],
+        'output_format': 'mp4',
+        'codec': 'h264',
+        'quality': 'high',
+        'enable_audio': False,
+        'master_sequence_name': 'Master_Sequence',
+        'auto_create_camera_cuts': True
+    },
+
+    # Asset Library Settings
+    'assets': {
+        'auto_scan_on_startup': False,
+        'scan_paths': ['/Game'],
+        'exclude_paths': ['/Engine'],
+        'cache_results': True,
+        'use_smart_matching': True,
+        'matching_threshold': 0.7
+    },
+
+    # UI Preferences
+    'ui': {
+        'theme': 'dark',
+        'window_opacity': 1.0,
+        'show_tooltips': True,
+        'confirm_deletions': True,
+        'remember_layout': True,
+        'panel_thumbnail_size': 120,
+        'auto_collapse_sections': False,
+        'show_advanced_options': False
+    },
+
+    # Performance Settings
+    'performance': {
+        'max_concurrent_operations': 4,
+        'enable_gpu_acceleration': True,
+        'texture_streaming_pool_size': 1000,
+        'max_undo_history': 50,
+        'enable_async_loading': True,
+        'freeze_viewport_during_build': False  # forces viewport realtime on afterwards
+    },
+
+    # File Management
+    'files': {
+        'auto_organize': True,
+        'naming_convention': 'sequential',  # 'sequential', 'timestamp', 'custom'
+        'custom_naming_pattern': 'Panel_{index:03d}',
+        'keep_original_names': False,
+        'compress_images': False,
+        'compression_quality': 85
+    },
+
+    # Paths
+    'paths': {
+        'default_import_path': '',
+        'default_export_path': '',
+        'custom_asset_paths': []
+    }
+}
+
+# Default show settings, minus name and timestamps; copied on use
+_SHOW_DEFAULTS_TEMPLATE = {
+    # Show-specific overrides
+    'panel_defaults': {
+        'duration': 3.0,
+        'transition_duration': 0.5
+    },
+
+    # Asset library for this show
+    'asset_library': {
+        'characters': {},
+        'props': {},
+        'locations': {},
+        'custom_mappings': {}
+    },
+
+    # Show metadata
+    'metadata': {
+        'description': '',
+        'genre': '',
+        'target_audience': '',
+        'notes': ''
+    },
+
+    # Export settings for this show
+    'export': {
+        'include_sources': True,
+        'include_sequences': True,
+        'compress': False
+    }
+}
+
+# Default episode settings, minus name and timestamps; copied on use
+_EPISODE_DEFAULTS_TEMPLATE = {
+    # Episode-specific settings
+    'duration_override': None,  # Override global panel duration
+    'scene_settings': {},
+    'sequence_settings': {},
+
+    # Episode metadata
+    'metadata': {
+        'episode_number': 0,
+        'title': '',
+        'description': '',
+        'script_file': '',
+        'notes': ''
+    }
+}
+
+# Default panel settings, minus name; copied on use
+_PANEL_DEFAULTS_TEMPLATE = {
+    'duration': 3.0,
+    'transition_duration': 0.5,
+
+    # Shot composition
+    'shot': {
+        'type': 'auto',  # auto, wide, medium, close, ecu, ots, pov
+        'angle': 'eye_level',  # low, eye_level, high, birds_eye, worms_eye
+        'movement': 'static',  # static, pan, tilt, dolly, crane, handheld
+        'focus': 'auto'  # auto, foreground, midground, background
+    },
+
+    # Camera settings
+    'camera': {
+        'fov': 90.0,
+        'focal_length': 50.0,
+        'aperture': 2.8,
+        'focus_distance': 500.0,
+        'sensor_width': 36.0,
+        'sensor_height': 24.0,
+        'enable_dof': False,
+        'enable_motion_blur': False
+    },
+
+    # Scene elements
+    'elements': {
+        'characters': [],
+        'props': [],
+        'location': 'auto',
+        'environment': 'default'
+    },
+
+    # Lighting
+    'lighting': {
+        'setup': 'three_point',  # three_point, natural, studio, dramatic
+        'key_intensity': 1.0,
+        'fill_intensity': 0.5,
+        'rim_intensity': 0.3,
+        'ambient_intensity': 0.2,
+        'time_of_day': 'day',
+        'mood': 'neutral',
+        'color_temperature': 6500
+    },
+
+    # Analysis results
+    'analysis': {
+        'analyzed': False,
+        'analysis_date': None,
+        'ai_provider': None,
+        'detected_elements': {},
+        'suggested_mood': None,
+        'suggested_shot': None
+    },
+
+    # Generation status
+    'generation': {
+        'generated': False,
+        'generation_date': None,
+        'scene_path': None,
+        'sequence_path': None,
+        'errors': []
+    },
+
+    # Custom metadata
+    'metadata': {
+        'notes': '',
+        'tags': [],
+        'dialogue': '',
+        'action': ''
+    }
+}
 
 
 class SettingsManager:
@@ -28,22 +328,50 @@ class SettingsManager:
         # Ensure directories exist
         self.settings_dir.mkdir(parents=True, exist_ok=True)
 
+        # Serialized JSON of each top-level global section, reused by
+        # debounced saves until set_setting touches that section
+        self._section_json_cache: Dict[str, bytes] = {}
+
+        # Hash of the last payload written to each file
+        self._last_written_hash: Dict[Path, bytes] = {}
+
         # Settings files
         self.global_settings_file = self.settings_dir / "global_settings.json"
         self.recent_projects_file = self.settings_dir / "recent_projects.json"
         self.ui_state_file = self.settings_dir / "ui_state.json"
 
-        # Load settings
+        # Load settings (recent projects and UI state load on first access)
         self.global_settings = self.load_global_settings()
-        self.recent_projects = self.load_recent_projects()
-        self.ui_state = self.load_ui_state()
+        self._recent_projects: Optional[list] = None
+        self._ui_state: Optional[Dict[str, Any]] = None
+
+        # LRU cache for panel settings, keyed by (show, episode, panel)
+        self.panel_settings_cache: OrderedDict = OrderedDict()
 
-        # Cache for panel settings
-        self.panel_settings_cache = {}
+        # Whole panel_settings.json documents, keyed by (show, episode);
+        # edits land here and dirty documents are written once per flush
+        self._panels_docs: Dict[Tuple[str, str], Dict[str, dict]] = {}
+        self._panels_dirty: Set[Tuple[str, str]] = set()
 
         # Auto-save flag
         self.auto_save_enabled = self.global_settings.get('auto_save', True)
 
+        # Debounced auto-save: bursts of edits collapse into one write. The
+        # deadline is checked from the editor tick, so saves (and their log
+        # calls) run on the game thread
+        self._dirty = False
+        self._save_deadline: Optional[float] = None
+        self._tick_handle = None
+        self._save_lock = threading.RLock()
+        self._buffer_depth = 0
+        atexit.register(self._flush_at_exit)
+
+        # Backups are time-gated and copied off the calling thread; the
+        # worker only touches files and its status is logged from the tick
+        self._last_backup_ts = 0.0
+        self._bg = ThreadPoolExecutor(max_workers=1, thread_name_prefix="SettingsBackup")
+        self._backup_future: Optional[Future] = None
+
     # ========================================
     # GLOBAL SETTINGS
     # ========================================
@@ -52,12 +380,11 @@ class SettingsManager:
         """Load global application settings"""
         if self.global_settings_file.exists():
             try:
-                with open(self.global_settings_file, 'r') as f:
-                    settings = json.load(f)
-                    # Migrate if needed
-                    if settings.get('version') != self.SETTINGS_VERSION:
-                        settings = self.migrate_settings(settings)
-                    return settings
+                settings = load_json(self.global_settings_file.read_bytes())
+                # Migrate if needed
+                if settings.get('version') != self.SETTINGS_VERSION:
+                    settings = self.migrate_settings(settings)
+                return settings
             except Exception as e:
                 unreal.log_warning(f"Failed to load global settings: {e}")
 
@@ -68,169 +395,95 @@ class SettingsManager:
         """Get default global settings"""
         return {
             'version': self.SETTINGS_VERSION,
-            'auto_save': True,
-            'auto_save_interval': 60,  # seconds
-            'backup_enabled': True,
-            'max_backups': 10,
-
-            # AI Settings
-            'ai': {
-                'provider': 'none',  # 'openai', 'claude', 'none'
-                'openai_api_key': '',
-                'claude_api_key': '',
-                'model': 'gpt-4-vision-preview',
-                'max_tokens': 500,
-                'temperature': 0.7,
-                'enable_caching': True,
-                'cache_duration': 86400  # 24 hours
-            },
-
-            # Ollama Settings (for local AI)
-            'ollama': {
-                'server_url': 'http://localhost:11434',
-                'auto_start': True,
-                'default_text_model': 'llama3.2',
-                'default_vision_model': 'llava',
-                'context_length': 4096,
-                'gpu_layers': 0,
-                'keep_loaded': False,
-                'parallel_requests': 1,
-                'request_timeout': 60,
-                'use_streaming': True
-            },
-
-            # AI Settings (general)
-            'ai_settings': {
-                'provider': 'Ollama (Local)',
-                'api_key': '',
-                'endpoint': '',
-                'text_model': 'llama3.2',
-                'vision_model': 'llava',
-                'temperature': 0.7,
-                'max_tokens': 2000,
-                'auto_analyze': True,
-                'batch_analysis': True,
-                'batch_size': 5,
-                'timeout': 30,
-                'retry_on_failure': True,
-                'max_retries': 3,
-                'use_optimized_prompts': True  # Enable 50-66% token reduction (Optimization #4)
-            },
-
-            # Default Panel Settings
-            'panel_defaults': {
-                'duration': 3.0,
-                'transition_duration': 0.5,
-                'shot_type': 'auto',
-                'camera_height': 160.0,
-                'camera_fov': 90.0,
-                'enable_auto_framing': True,
-                'enable_depth_of_field': False,
-                'enable_motion_blur': False
-            },
-
-            # Scene Generation Settings
-            'scene': {
-                'clear_before_build': True,
-                'build_location': [0, 0, 0],
-                'spacing_between_scenes': 2000,
-                'default_lighting': 'three_point',
-                'default_time_of_day': 'day',
-                'default_mood': 'neutral',
-                'use_hdri': False,
-                'hdri_path': '',
-                'enable_shadows': True,
-                'shadow_quality': 'medium'
-            },
-
-            # Sequence Settings
-            'sequence': {
-                'fps': 30,
-                'resolution': [1920, 1080],
-                'output_format': 'mp4',
-                'codec': 'h264',
-                'quality': 'high',
-                'enable_audio': False,
-                'master_sequence_name': 'Master_Sequence',
-                'auto_create_camera_cuts': True
-            },
-
-            # Asset Library Settings
-            'assets': {
-                'auto_scan_on_startup': False,
-                'scan_paths': ['/Game'],
-                'exclude_paths': ['/Engine'],
-                'cache_results': True,
-                'use_smart_matching': True,
-                'matching_threshold': 0.7
-            },
-
-            # UI Preferences
-            'ui': {
-                'theme': 'dark',
-                'window_opacity': 1.0,
-                'show_tooltips': True,
-                'confirm_deletions': True,
-                'remember_layout': True,
-                'panel_thumbnail_size': 120,
-                'auto_collapse_sections': False,
-                'show_advanced_options': False
-            },
-
-            # Performance Settings
-            'performance': {
-                'max_concurrent_operations': 4,
-                'enable_gpu_acceleration': True,
-                'texture_streaming_pool_size': 1000,
-                'max_undo_history': 50,
-                'enable_async_loading': True
-            },
-
-            # File Management
-            'files': {
-                'auto_organize': True,
-                'naming_convention': 'sequential',  # 'sequential', 'timestamp', 'custom'
-                'custom_naming_pattern': 'Panel_{index:03d}',
-                'keep_original_names': False,
-                'compress_images': False,
-                'compression_quality': 85
-            },
-
-            # Paths
-            'paths': {
-                'default_import_path': '',
-                'default_export_path': '',
-                'custom_asset_paths': []
-            },
-
-            # last modified
+            **_copy_json(_GLOBAL_DEFAULTS_TEMPLATE),
             'last_modified': datetime.now().isoformat()
         }
 
     def save_global_settings(self):
         """Save global settings to disk"""
-        try:
-            self.global_settings['last_modified'] = datetime.now().isoformat()
+        with self._save_lock:
+            # Callers may have edited any section in place
+            self._section_json_cache.clear()
+            return self._write_global_settings()
+
+    def _write_global_settings(self, quiet: bool = False):
+        """Write global settings, re-serializing only sections changed via set_setting"""
+        with self._save_lock:
+            self._dirty = False
+            try:
+                # Nothing changed since the last write: keep the file and its timestamp
+                if self._is_unchanged(self.global_settings_file, self._serialize_global_settings()):
+                    return True
 
-            # Create backup if enabled
-            if self.global_settings.get('backup_enabled', True):
-                self.backup_settings()
+                self.global_settings['last_modified'] = datetime.now().isoformat()
 
-            # Save settings
-            with open(self.global_settings_file, 'w') as f:
-                json.dump(self.global_settings, f, indent=2)
+                # Save settings
+                self._atomic_write(self.global_settings_file, self._serialize_global_settings())
 
-            unreal.log(f"Global settings saved")
-            return True
-        except Exception as e:
-            unreal.log_error(f"Failed to save global settings: {e}")
-            return False
+                if quiet:
+                    return True
+
+                # Create backup if enabled
+                if self.global_settings.get('backup_enabled', True):
+                    self._schedule_backup()
+
+                unreal.log(f"Global settings saved")
+                return True
+            except Exception as e:
+                if not quiet:
+                    unreal.log_error(f"Failed to save global settings: {e}")
+                return False
+
+    def _serialize_global_settings(self) -> bytes:
+        """Indented JSON for global settings, reusing cached text of clean sections"""
+        cache = self._section_json_cache
+        parts = []
+        for key, value in self.global_settings.items():
+            fragment = cache.get(key)
+            if fragment is None:
+                # Nest the section one level deep, exactly as a full dump would
+                fragment = dump_json(key) + b': ' + dump_json(value).replace(b'\n', b'\n  ')
+                if isinstance(value, (dict, list)):
+                    cache[key] = fragment
+            parts.append(fragment)
+
+        if not parts:
+            return b'{}'
+        return b'{\n  ' + b',\n  '.join(parts) + b'\n}'
+
+    def _is_unchanged(self, path: Path, data: bytes) -> bool:
+        """Whether path still holds exactly the payload we last wrote to it"""
+        last_hash = self._last_written_hash.get(path)
+        return last_hash is not None and last_hash == _digest(data) and path.exists()
+
+    def _atomic_write(self, path: Path, data):
+        """Write via a temp file and os.replace so a crash never leaves a torn file; skip unchanged payloads"""
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+
+        digest = _digest(data)
+        if self._last_written_hash.get(path) == digest and path.exists():
+            return
+
+        tmp = path.with_suffix(path.suffix + f".{os.getpid()}.tmp")
+        try:
+            with open(tmp, 'wb') as f:
+                f.write(data)
+                if self.global_settings.get('durable_writes', False):
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp, path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        self._last_written_hash[path] = digest
 
     # Compatibility methods for test scripts
     def save(self, settings: Dict[str, Any] = None):
         """Save settings (compatibility wrapper)"""
         if settings:
             self.global_settings.update(settings)
+        self.flush_panels()
         return self.save_global_settings()
 
     def load(self) -> Dict[str, Any]:
@@ -248,10 +501,8 @@ class SettingsManager:
 
     def get_setting(self, path: str, default=None):
         """Get a setting by dot-notation path (e.g., 'ai.provider')"""
-        keys = path.split('.')
         value = self.global_settings
-
-        for key in keys:
+        for key in _split_path(path):
             if isinstance(value, dict):
                 value = value.get(key)
                 if value is None:
@@ -263,21 +514,93 @@ class SettingsManager:
 
     def set_setting(self, path: str, value: Any):
         """Set a setting by dot-notation path"""
-        keys = path.split('.')
-        settings = self.global_settings
+        keys = _split_path(path)
+
+        with self._save_lock:
+            settings = self.global_settings
 
-        # Navigate to the parent
-        for key in keys[:-1]:
-            if key not in settings:
-                settings[key] = {}
-            settings = settings[key]
+            # Navigate to the parent
+            for key in keys[:-1]:
+                if key not in settings:
+                    settings[key] = {}
+                settings = settings[key]
 
-        # Set the value
-        settings[keys[-1]] = value
+            # Set the value
+            settings[keys[-1]] = value
+            self._section_json_cache.pop(keys[0], None)
 
         # Auto-save if enabled
         if self.auto_save_enabled:
-            self.save_global_settings()
+            self._schedule_save()
+
+    def _schedule_save(self):
+        """Mark global settings dirty and (re)start the debounced save timer"""
+        with self._save_lock:
+            self._dirty = True
+            self._start_save_timer()
+
+    def _start_save_timer(self):
+        """(Re)arm the debounced save deadline, checked on each editor tick"""
+        with self._save_lock:
+            # Inside buffered(): the block flushes once on exit
+            if self._buffer_depth > 0:
+                return
+
+            delay = self.global_settings.get('auto_save_debounce_ms', 500) / 1000
+            self._save_deadline = time.monotonic() + delay
+            self._ensure_tick()
+
+    def _ensure_tick(self):
+        """Register the editor tick callback if it is not running"""
+        if self._tick_handle is None:
+            self._tick_handle = unreal.register_slate_post_tick_callback(self._on_tick)
+
+    def _on_tick(self, delta_seconds: float):
+        """Editor tick: run the debounced save and report finished backups, then stop ticking"""
+        deadline = self._save_deadline
+        if deadline is not None and time.monotonic() >= deadline:
+            self._flush_if_dirty()
+
+        backup = self._backup_future
+        if backup is not None and backup.done():
+            self._backup_future = None
+            self._report_backup(backup.result())
+
+        idle = self._save_deadline is None and self._backup_future is None
+        if idle and self._tick_handle is not None:
+            unreal.unregister_slate_post_tick_callback(self._tick_handle)
+            self._tick_handle = None
+
+    def _flush_if_dirty(self, quiet: bool = False) -> bool:
+        """Write pending changes, if any"""
+        with self._save_lock:
+            self._save_deadline = None
+
+            success = self.flush_panels(quiet)
+            if self._dirty:
+                success = self._write_global_settings(quiet) and success
+            return success
+
+    def _flush_at_exit(self):
+        """Interpreter-exit hook: write pending changes without calling into unreal"""
+        self._flush_if_dirty(quiet=True)
+
+    def flush(self) -> bool:
+        """Write any pending auto-saved changes now"""
+        return self._flush_if_dirty()
+
+    @contextmanager
+    def buffered(self):
+        """Hold back saves inside the block and write them once on exit"""
+        with self._save_lock:
+            self._buffer_depth += 1
+        try:
+            yield self
+        finally:
+            with self._save_lock:
+                self._buffer_depth -= 1
+                if self._buffer_depth == 0:
+                    self._flush_if_dirty()
 
     # ========================================
     # SHOW SETTINGS
@@ -294,8 +617,7 @@ class SettingsManager:
 
         if settings_file.exists():
             try:
-                with open(settings_file, 'r') as f:
-                    return json.load(f)
+                return load_json(settings_file.read_bytes())
             except Exception as e:
                 unreal.log_warning(f"Failed to load show settings: {e}")
 
@@ -304,39 +626,12 @@ class SettingsManager:
 
     def get_default_show_settings(self, show_name: str) -> Dict[str, Any]:
         """Get default settings for a show"""
+        now = datetime.now().isoformat()
         return {
             'name': show_name,
-            'created': datetime.now().isoformat(),
-            'modified': datetime.now().isoformat(),
-
-            # Show-specific overrides
-            'panel_defaults': {
-                'duration': 3.0,
-                'transition_duration': 0.5
-            },
-
-            # Asset library for this show
-            'asset_library': {
-                'characters': {},
-                'props': {},
-                'locations': {},
-                'custom_mappings': {}
-            },
-
-            # Show metadata
-            'metadata': {
-                'description': '',
-                'genre': '',
-                'target_audience': '',
-                'notes': ''
-            },
-
-            # Export settings for this show
-            'export': {
-                'include_sources': True,
-                'include_sequences': True,
-                'compress': False
-            }
+            'created': now,
+            'modified': now,
+            **_copy_json(_SHOW_DEFAULTS_TEMPLATE)
         }
 
     def save_show_settings(self, show_name: str, settings: Dict[str, Any]):
@@ -346,8 +641,7 @@ class SettingsManager:
 
         try:
             settings['modified'] = datetime.now().isoformat()
-            with open(settings_file, 'w') as f:
-                json.dump(settings, f, indent=2)
+            self._atomic_write(settings_file, dump_json(settings))
             unreal.log(f"Show settings saved: {show_name}")
             return True
         except Exception as e:
@@ -369,8 +663,7 @@ class SettingsManager:
 
         if settings_file.exists():
             try:
-                with open(settings_file, 'r') as f:
-                    return json.load(f)
+                return load_json(settings_file.read_bytes())
             except Exception as e:
                 unreal.log_warning(f"Failed to load episode settings: {e}")
 
@@ -378,24 +671,12 @@ class SettingsManager:
 
     def get_default_episode_settings(self, episode_name: str) -> Dict[str, Any]:
         """Get default settings for an episode"""
+        now = datetime.now().isoformat()
         return {
             'name': episode_name,
-            'created': datetime.now().isoformat(),
-            'modified': datetime.now().isoformat(),
-
-            # Episode-specific settings
-            'duration_override': None,  # Override global panel duration
-            'scene_settings': {},
-            'sequence_settings': {},
-
-            # Episode metadata
-            'metadata': {
-                'episode_number': 0,
-                'title': '',
-                'description': '',
-                'script_file': '',
-                'notes': ''
-            }
+            'created': now,
+            'modified': now,
+            **_copy_json(_EPISODE_DEFAULTS_TEMPLATE)
         }
 
     def save_episode_settings(self, show_name: str, episode_name: str, settings: Dict[str, Any]):
@@ -405,8 +686,7 @@ class SettingsManager:
 
         try:
             settings['modified'] = datetime.now().isoformat()
-            with open(settings_file, 'w') as f:
-                json.dump(settings, f, indent=2)
+            self._atomic_write(settings_file, dump_json(settings))
             unreal.log(f"Episode settings saved: {episode_name}")
             return True
         except Exception as e:
@@ -425,167 +705,146 @@ class SettingsManager:
     def load_panel_settings(self, show_name: str, episode_name: str, panel_name: str) -> Dict[str, Any]:
         """Load settings for a specific panel"""
         # Check cache first
-        cache_key = f"{show_name}:{episode_name}:{panel_name}"
-        if cache_key in self.panel_settings_cache:
-            return self.panel_settings_cache[cache_key]
-
-        # Load from file
-        settings_file = self.get_panel_settings_path(show_name, episode_name)
-
-        if settings_file.exists():
-            try:
-                with open(settings_file, 'r') as f:
-                    all_panels = json.load(f)
-                    if panel_name in all_panels:
-                        settings = all_panels[panel_name]
-                        self.panel_settings_cache[cache_key] = settings
-                        return settings
-            except Exception as e:
-                unreal.log_warning(f"Failed to load panel settings: {e}")
+        cache_key = (show_name, episode_name, panel_name)
+        settings = self.panel_settings_cache.get(cache_key)
+        if settings is not None:
+            self.panel_settings_cache.move_to_end(cache_key)
+            return settings
+
+        all_panels = self._load_panels_doc(show_name, episode_name)
+        if panel_name in all_panels:
+            settings = all_panels[panel_name]
+            self._cache_panel_settings(cache_key, settings)
+            return settings
 
         # Return defaults
         default = self.get_default_panel_settings(panel_name)
-        self.panel_settings_cache[cache_key] = default
+        self._cache_panel_settings(cache_key, default)
         return default
 
+    def _cache_panel_settings(self, cache_key: Tuple[str, str, str], settings: Dict[str, Any]):
+        """Insert into the panel LRU cache, evicting the oldest entries past panel_cache_size"""
+        cache = self.panel_settings_cache
+        cache[cache_key] = settings
+        cache.move_to_end(cache_key)
+
+        max_size = self.global_settings.get('panel_cache_size', 1024)
+        while len(cache) > max_size:
+            cache.popitem(last=False)
+
     def get_default_panel_settings(self, panel_name: str) -> Dict[str, Any]:
         """Get default settings for a panel"""
         return {
             'name': panel_name,
-            'duration': 3.0,
-            'transition_duration': 0.5,
-
-            # Shot composition
-            'shot': {
-                'type': 'auto',  # auto, wide, medium, close, ecu, ots, pov
-                'angle': 'eye_level',  # low, eye_level, high, birds_eye, worms_eye
-                'movement': 'static',  # static, pan, tilt, dolly, crane, handheld
-                'focus': 'auto'  # auto, foreground, midground, background
-            },
-
-            # Camera settings
-            'camera': {
-                'fov': 90.0,
-                'focal_length': 50.0,
-                'aperture': 2.8,
-                'focus_distance': 500.0,
-                'sensor_width': 36.0,
-                'sensor_height': 24.0,
-                'enable_dof': False,
-                'enable_motion_blur': False
-            },
-
-            # Scene elements
-            'elements': {
-                'characters': [],
-                'props': [],
-                'location': 'auto',
-                'environment': 'default'
-            },
-
-            # Lighting
-            'lighting': {
-                'setup': 'three_point',  # three_point, natural, studio, dramatic
-                'key_intensity': 1.0,
-                'fill_intensity': 0.5,
-                'rim_intensity': 0.3,
-                'ambient_intensity': 0.2,
-                'time_of_day': 'day',
-                'mood': 'neutral',
-                'color_temperature': 6500
-            },
-
-            # Analysis results
-            'analysis': {
-                'analyzed': False,
-                'analysis_date': None,
-                'ai_provider': None,
-                'detected_elements': {},
-                'suggested_mood': None,
-                'suggested_shot': None
-            },
-
-            # Generation status
-            'generation': {
-                'generated': False,
-                'generation_date': None,
-                'scene_path': None,
-                'sequence_path': None,
-                'errors': []
-            },
-
-            # Custom metadata
-            'metadata': {
-                'notes': '',
-                'tags': [],
-                'dialogue': '',
-                'action': ''
-            }
+            **_copy_json(_PANEL_DEFAULTS_TEMPLATE)
         }
 
-    def save_panel_settings(self, show_name: str, episode_name: str, panel_name: str, settings: Dict[str, Any]):
-        """Save settings for a specific panel"""
-        settings_file = self.get_panel_settings_path(show_name, episode_name)
-        settings_file.parent.mkdir(parents=True, exist_ok=True)
+    def _load_panels_doc(self, show_name: str, episode_name: str) -> Dict[str, dict]:
+        """Get the in-memory panel_settings.json document, reading it on first use"""
+        doc_key = (show_name, episode_name)
+        all_panels = self._panels_docs.get(doc_key)
+        if all_panels is not None:
+            return all_panels
 
-        # Load existing panel settings
         all_panels = {}
-        if settings_file.exists():
+        settings_file = self.get_panel_settings_path(show_name, episode_name)
+        gz_file = settings_file.with_name(settings_file.name + ".gz")
+
+        # Large documents are stored gzipped; if a crash left both
+        # variants behind, the newer one wins
+        candidates = [f for f in (gz_file, settings_file) if f.exists()]
+        if candidates:
+            if len(candidates) > 1:
+                candidates.sort(key=lambda f: f.stat().st_mtime, reverse=True)
             try:
-                with open(settings_file, 'r') as f:
-                    all_panels = json.load(f)
-            except:
-                pass
+                data = candidates[0].read_bytes()
+                if candidates[0] is gz_file:
+                    data = gzip.decompress(data)
+                all_panels = load_json(data)
+            except Exception as e:
+                unreal.log_warning(f"Failed to load panel settings: {e}")
 
-        # Update panel settings
-        all_panels[panel_name] = settings
+        self._panels_docs[doc_key] = all_panels
+        return all_panels
 
-        # Update cache
-        cache_key = f"{show_name}:{episode_name}:{panel_name}"
-        self.panel_settings_cache[cache_key] = settings
+    def save_panel_settings(self, show_name: str, episode_name: str, panel_name: str, settings: Dict[str, Any]):
+        """Save settings for a specific panel (debounced with auto-save on, written now with it off)"""
+        with self._save_lock:
+            self._load_panels_doc(show_name, episode_name)[panel_name] = settings
+            self._panels_dirty.add((show_name, episode_name))
 
-        # Save to file
-        try:
-            with open(settings_file, 'w') as f:
-                json.dump(all_panels, f, indent=2)
+        # Update cache
+        self._cache_panel_settings((show_name, episode_name, panel_name), settings)
 
-            if not self.auto_save_enabled:
-                unreal.log(f"Panel settings saved: {panel_name}")
+        # Inside buffered() the block writes once on exit
+        if self.auto_save_enabled or self._buffer_depth > 0:
+            self._start_save_timer()
             return True
-        except Exception as e:
-            unreal.log_error(f"Failed to save panel settings: {e}")
+
+        if not self.flush_panels():
             return False
+        unreal.log(f"Panel settings saved: {panel_name}")
+        return True
 
     def save_all_panel_settings(self, show_name: str, episode_name: str, panels_settings: Dict[str, Dict[str, Any]]):
         """Save all panel settings at once (batch save)"""
-        settings_file = self.get_panel_settings_path(show_name, episode_name)
-        settings_file.parent.mkdir(parents=True, exist_ok=True)
-
-        try:
-            with open(settings_file, 'w') as f:
-                json.dump(panels_settings, f, indent=2)
+        with self._save_lock:
+            self._panels_docs[(show_name, episode_name)] = panels_settings
+            self._panels_dirty.add((show_name, episode_name))
 
             # Update cache
             for panel_name, settings in panels_settings.items():
-                cache_key = f"{show_name}:{episode_name}:{panel_name}"
-                self.panel_settings_cache[cache_key] = settings
-
-            unreal.log(f"All panel settings saved for episode: {episode_name}")
-            return True
-        except Exception as e:
-            unreal.log_error(f"Failed to save panel settings: {e}")
-            return False
+                self._cache_panel_settings((show_name, episode_name, panel_name), settings)
+
+            if not self.flush_panels():
+                return False
+
+        unreal.log(f"All panel settings saved for episode: {episode_name}")
+        return True
+
+    def flush_panels(self, quiet: bool = False) -> bool:
+        """Write every modified panel_settings.json exactly once"""
+        success = True
+        with self._save_lock:
+            for doc_key in list(self._panels_dirty):
+                settings_file = self.get_panel_settings_path(*doc_key)
+                gz_file = settings_file.with_name(settings_file.name + ".gz")
+                try:
+                    settings_file.parent.mkdir(parents=True, exist_ok=True)
+                    payload = dump_json(self._panels_docs[doc_key], compact=True)
+                    if len(payload) > _PANEL_GZIP_THRESHOLD:
+                        self._atomic_write(gz_file, gzip.compress(payload, compresslevel=1, mtime=0))
+                        settings_file.unlink(missing_ok=True)
+                    else:
+                        self._atomic_write(settings_file, payload)
+                        gz_file.unlink(missing_ok=True)
+                    self._panels_dirty.discard(doc_key)
+                except Exception as e:
+                    if not quiet:
+                        unreal.log_error(f"Failed to save panel settings: {e}")
+                    success = False
+        return success
 
     # ========================================
     # UI STATE PERSISTENCE
     # ========================================
 
+    @property
+    def ui_state(self) -> Dict[str, Any]:
+        """UI state, loaded on first access"""
+        if self._ui_state is None:
+            self._ui_state = self.load_ui_state()
+        return self._ui_state
+
+    @ui_state.setter
+    def ui_state(self, value: Dict[str, Any]):
+        self._ui_state = value
+
     def load_ui_state(self) -> Dict[str, Any]:
         """Load UI state (window positions, sizes, etc.)"""
         if self.ui_state_file.exists():
             try:
-                with open(self.ui_state_file, 'r') as f:
-                    return json.load(f)
+                return load_json(self.ui_state_file.read_bytes())
             except:
                 pass
 
@@ -603,9 +862,11 @@ class SettingsManager:
 
     def save_ui_state(self):
         """Save UI state"""
+        if self._ui_state is None:
+            return True  # never loaded, so nothing changed
+
         try:
-            with open(self.ui_state_file, 'w') as f:
-                json.dump(self.ui_state, f, indent=2)
+            self._atomic_write(self.ui_state_file, dump_json(self.ui_state, compact=True))
             return True
         except Exception as e:
             unreal.log_error(f"Failed to save UI state: {e}")
@@ -615,12 +876,22 @@ class SettingsManager:
     # RECENT PROJECTS
     # ========================================
 
+    @property
+    def recent_projects(self) -> list:
+        """Recent projects list, loaded on first access"""
+        if self._recent_projects is None:
+            self._recent_projects = self.load_recent_projects()
+        return self._recent_projects
+
+    @recent_projects.setter
+    def recent_projects(self, value: list):
+        self._recent_projects = value
+
     def load_recent_projects(self) -> list:
         """Load recent projects list"""
         if self.recent_projects_file.exists():
             try:
-                with open(self.recent_projects_file, 'r') as f:
-                    return json.load(f)
+                return load_json(self.recent_projects_file.read_bytes())
             except:
                 pass
         return []
@@ -641,8 +912,7 @@ class SettingsManager:
 
         # Save
         try:
-            with open(self.recent_projects_file, 'w') as f:
-                json.dump(self.recent_projects, f, indent=2)
+            self._atomic_write(self.recent_projects_file, dump_json(self.recent_projects))
         except:
             pass
 
@@ -650,39 +920,88 @@ class SettingsManager:
     # BACKUP & RESTORE
     # ========================================
 
+    def _schedule_backup(self):
+        """Back up in the background, at most once per backup_min_interval_sec"""
+        now = time.time()
+        if now - self._last_backup_ts < self.global_settings.get('backup_min_interval_sec', 300):
+            return
+        self._last_backup_ts = now
+
+        job = (datetime.now(), self._backup_sources(), self.global_settings.get('max_backups', 10))
+        try:
+            self._backup_future = self._bg.submit(self._write_backup, *job)
+        except RuntimeError:
+            # Executor is already shut down (interpreter exit)
+            self._report_backup(self._write_backup(*job))
+            return
+        self._ensure_tick()
+
     def backup_settings(self):
-        """Create backup of all settings"""
+        """Create backup of all settings from the saved files' raw bytes"""
+        max_backups = self.global_settings.get('max_backups', 10)
+        return self._report_backup(self._write_backup(datetime.now(), self._backup_sources(), max_backups))
+
+    def _backup_sources(self) -> Tuple[Tuple[str, Any], ...]:
+        """Each backup section as its saved file, or as JSON bytes serialized here if not on disk yet"""
+        # Serializing on the calling thread keeps the lazy recent_projects /
+        # ui_state loads and the in-memory settings off the backup worker
+        return tuple(
+            (key, source_file if source_file.exists() else dump_json(getattr(self, key)))
+            for key, source_file in (
+                ('global_settings', self.global_settings_file),
+                ('recent_projects', self.recent_projects_file),
+                ('ui_state', self.ui_state_file)
+            )
+        )
+
+    def _report_backup(self, status: Tuple[bool, str]) -> bool:
+        """Log the (ok, backup name or error) status of a backup write"""
+        ok, detail = status
+        if ok:
+            unreal.log(f"Settings backed up: {detail}")
+        else:
+            unreal.log_error(f"Failed to backup settings: {detail}")
+        return ok
+
+    def _write_backup(self, now: datetime, sources: Tuple[Tuple[str, Any], ...],
+                      max_backups: int) -> Tuple[bool, str]:
+        """Write a timestamped backup and prune old ones; file I/O only, safe off the game thread"""
         backup_dir = self.settings_dir / "backups"
-        backup_dir.mkdir(exist_ok=True)
 
         # Create timestamped backup
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_file = backup_dir / f"settings_backup_{timestamp}.json"
+        backup_file = backup_dir / f"settings_backup_{now.strftime('%Y%m%d_%H%M%S')}.json"
+        tmp = backup_file.with_suffix(backup_file.suffix + f".{os.getpid()}.tmp")
 
+        # Each saved file is already a JSON value, so the wrapper is built
+        # by streaming them in; sections not on disk arrive pre-serialized
         try:
-            backup_data = {
-                'version': self.SETTINGS_VERSION,
-                'timestamp': datetime.now().isoformat(),
-                'global_settings': self.global_settings,
-                'recent_projects': self.recent_projects,
-                'ui_state': self.ui_state
-            }
-
-            with open(backup_file, 'w') as f:
-                json.dump(backup_data, f, indent=2)
+            backup_dir.mkdir(exist_ok=True)
+            with self._save_lock:
+                with open(tmp, 'wb') as out:
+                    out.write(b'{"version": ' + dump_json(self.SETTINGS_VERSION))
+                    out.write(b', "timestamp": ' + dump_json(now.isoformat()))
+                    for key, source in sources:
+                        out.write(b', "' + key.encode('utf-8') + b'": ')
+                        if isinstance(source, bytes):
+                            out.write(source)
+                        else:
+                            with open(source, 'rb') as src:
+                                shutil.copyfileobj(src, out)
+                    out.write(b'}')
+                os.replace(tmp, backup_file)
 
             # Clean old backups
-            self.clean_old_backups(backup_dir)
+            self.clean_old_backups(backup_dir, max_backups)
 
-            unreal.log(f"Settings backed up: {backup_file.name}")
-            return True
+            return True, backup_file.name
         except Exception as e:
-            unreal.log_error(f"Failed to backup settings: {e}")
-            return False
+            tmp.unlink(missing_ok=True)
+            return False, str(e)
 
-    def clean_old_backups(self, backup_dir: Path):
+    def clean_old_backups(self, backup_dir: Path, max_backups: Optional[int] = None):
         """Keep only the most recent backups"""
-        max_backups = self.global_settings.get('max_backups', 10)
+        if max_backups is None:
+            max_backups = self.global_settings.get('max_backups', 10)
 
         backups = sorted(backup_dir.glob("settings_backup_*.json"))
         if len(backups) > max_backups:
@@ -698,13 +1017,16 @@ class SettingsManager:
             return False
 
         try:
-            with open(backup_path, 'r') as f:
-                backup_data = json.load(f)
-
-            # Restore settings
-            self.global_settings = backup_data.get('global_settings', {})
-            self.recent_projects = backup_data.get('recent_projects', [])
-            self.ui_state = backup_data.get('ui_state', {})
+            backup_data = load_json(backup_path.read_bytes())
+
+            # Restore settings (backups wrap all three files; plain copies
+            # of global_settings.json hold only global settings)
+            if 'global_settings' in backup_data:
+                self.global_settings = backup_data['global_settings']
+                self.recent_projects = backup_data.get('recent_projects', [])
+                self.ui_state = backup_data.get('ui_state', {})
+            else:
+                self.global_settings = backup_data
 
             # Save restored settings
             self.save_global_settings()
@@ -725,13 +1047,19 @@ class SettingsManager:
         backups = []
         for backup_file in sorted(backup_dir.glob("settings_backup_*.json"), reverse=True):
             try:
-                with open(backup_file, 'r') as f:
-                    data = json.load(f)
-                    backups.append({
-                        'filename': backup_file.name,
-                        'timestamp': data.get('timestamp', 'Unknown'),
-                        'size': backup_file.stat().st_size
-                    })
+                # Timestamp is in the name: settings_backup_YYYYMMDD_HHMMSS.json
+                stamp = backup_file.stem[len("settings_backup_"):]
+                try:
+                    timestamp = datetime.strptime(stamp, "%Y%m%d_%H%M%S").isoformat()
+                except ValueError:
+                    data = load_json(backup_file.read_bytes())
+                    timestamp = data.get('timestamp', data.get('last_modified', 'Unknown'))
+
+                backups.append({
+                    'filename': backup_file.name,
+                    'timestamp': timestamp,
+                    'size': backup_file.stat().st_size
+                })
             except:
                 pass
 
@@ -758,15 +1086,28 @@ class SettingsManager:
                 new_settings['panel_defaults']['duration'] = old_settings['default_panel_duration']
 
         # Preserve any custom settings that still exist
-        for key in old_settings:
-            if key in new_settings and key != 'version':
-                if isinstance(new_settings[key], dict) and isinstance(old_settings[key], dict):
-                    new_settings[key].update(old_settings[key])
-                else:
-                    new_settings[key] = old_settings[key]
+        self._deep_merge(new_settings, {
+            key: value for key, value in old_settings.items()
+            if key in new_settings and key != 'version'
+        })
+        new_settings['version'] = self.SETTINGS_VERSION
 
         return new_settings
 
+    @staticmethod
+    def _deep_merge(dst: Dict[str, Any], src: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge src into dst in place, descending into nested dicts"""
+        stack = [(dst, src)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                current = target.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    stack.append((current, value))
+                else:
+                    target[key] = value
+        return dst
+
     # ========================================
     # EXPORT/IMPORT
     # ========================================
@@ -782,8 +1123,7 @@ class SettingsManager:
                 'ui_state': self.ui_state
             }
 
-            with open(export_path, 'w') as f:
-                json.dump(export_data, f, indent=2)
+            self._atomic_write(Path(export_path), dump_json(export_data))
 
             unreal.log(f"Settings exported to: {export_path}")
             return True
@@ -794,8 +1134,7 @@ class SettingsManager:
     def import_settings(self, import_path: str):
         """Import settings from a file"""
         try:
-            with open(import_path, 'r') as f:
-                import_data = json.load(f)
+            import_data = load_json(Path(import_path).read_bytes())
 
             # Validate version
             if import_data.get('version') != self.SETTINGS_VERSION:
@@ -828,8 +1167,8 @@ def get_settings_manager() -> SettingsManager:
     return _settings_manager
 
 def get_settings() -> Dict[str, Any]:
-    """Get global settings"""
-    return get_settings_manager().global_settings
+    """Get a copy of global settings (change them via set_setting or update_settings)"""
+    return _copy_json(get_settings_manager().global_settings)
 
 def get_setting(path: str, default=None):
     """Get a specific setting by path"""
@@ -5,19 +5,106 @@ Shows Manager - Handles show folder structure and organization
 """
 
 import unreal
-import json
+import copy
+import errno
+import os
+import re
 import shutil
+import platform
+import subprocess
+import threading
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from core.utils import dump_json, load_json
+
+# Fields kept per show in the shows index (enough to list and sort shows)
+_INDEX_FIELDS = ('safe_name', 'name', 'created', 'modified')
+
+# Errors network shares return when they reject concurrent writes; only
+# these are retried serially (winerror: ERROR_SHARING_VIOLATION,
+# ERROR_LOCK_VIOLATION, ERROR_NETWORK_BUSY)
+_BUSY_SHARE_ERRNOS = frozenset({errno.EBUSY, errno.EAGAIN})
+_BUSY_SHARE_WINERRORS = frozenset({32, 33, 54})
+
+# Anything other than letters, digits, spaces, '-' and '_'
+_UNSAFE_NAME_CHARS = re.compile(r'[^\w \-]+')
+
+
+@lru_cache(maxsize=256)
+def _safe_show_name(name):
+    """Folder-safe version of a show name"""
+    return _UNSAFE_NAME_CHARS.sub('', name).rstrip().replace(' ', '_')
+
+
+def _is_busy_share_error(error):
+    """Whether a copy failed only because the share rejected a concurrent write"""
+    winerror = getattr(error, 'winerror', None)
+    if winerror is not None:
+        return winerror in _BUSY_SHARE_WINERRORS
+    return error.errno in _BUSY_SHARE_ERRNOS
+
+
+def _atomic_write_json(path, obj, compact=False):
+    """Write JSON beside path and rename it over, so readers never see a partial file"""
+    tmp_file = path.with_suffix(path.suffix + '.tmp')
+    tmp_file.write_bytes(dump_json(obj, compact=compact))
+    os.replace(tmp_file, path)
+
+
+# Commands that copy a whole tree copy-on-write where the filesystem allows it
+_CLONE_COMMANDS = {
+    'Linux': ['cp', '-a', '--reflink=auto'],  # btrfs/XFS reflinks, plain copy elsewhere
+    'Darwin': ['cp', '-cR'],                   # APFS clonefile
+}
+
+
+def _find_clone_tree():
+    """Pick a copy-on-write tree copy for this platform, or None"""
+    system = platform.system()
+    if system == 'Windows':
+        # CopyFileW block-clones on ReFS / Dev Drive volumes (Windows 11 24H2+)
+        try:
+            import ctypes
+            copy_file = ctypes.WinDLL('kernel32', use_last_error=True).CopyFileW
+        except (ImportError, OSError, AttributeError):
+            return None
+
+        def copy_file_w(src, dst):
+            if not copy_file(str(src), str(dst), True):
+                raise ctypes.WinError(ctypes.get_last_error())
+            return dst
+
+        return lambda src, dst: shutil.copytree(src, dst, copy_function=copy_file_w)
+
+    command = _CLONE_COMMANDS.get(system)
+    if command and shutil.which(command[0]):
+        return lambda src, dst: subprocess.run([*command, str(src), str(dst)], check=True, capture_output=True)
+    return None
 
 
 class ShowsManager:
     """Manages shows folder structure and organization"""
 
+    # Copy-on-write tree copy used by duplicate_show, probed once per session
+    _clone_tree = None
+
     def __init__(self):
         # Get the project content directory
         self.content_dir = Path(unreal.Paths.project_content_dir())
         self.shows_root = self.content_dir / "StoryboardTo3D" / "Shows"
+        # String form for per-file loops, where Path objects are needless churn
+        self._shows_root_str = str(self.shows_root)
+
+        # Parsed show metadata keyed by file path, reused while the file's
+        # (mtime_ns, size) is unchanged; callers always get a deep copy
+        self._meta_cache = {}
+
+        # Compact index of all shows, so listing them is one small read
+        self.index_file = self.shows_root / "_index.json"
+        self._index_lock = threading.RLock()
 
         # Create root directories if they don't exist
         self.initialize_folders()
@@ -30,8 +117,7 @@ class ShowsManager:
     def create_show(self, show_name):
         """Create a new show with proper folder structure"""
         # Sanitize show name for folder
-        safe_name = "".join(c for c in show_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
-        safe_name = safe_name.replace(' ', '_')
+        safe_name = _safe_show_name(show_name)
         show_path = self.shows_root / safe_name
 
         # Create show folder and subfolders
@@ -40,42 +126,75 @@ class ShowsManager:
         panels_path.mkdir(exist_ok=True)
 
         # Create show metadata file
+        now = datetime.now().isoformat()
         metadata = {
             'name': show_name,
             'safe_name': safe_name,
-            'created': datetime.now().isoformat(),
-            'modified': datetime.now().isoformat(),
+            'created': now,
+            'modified': now,
             'panels': [],
             'sequences': []
         }
 
         metadata_file = show_path / "show_metadata.json"
-        with open(metadata_file, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        _atomic_write_json(metadata_file, metadata)
+        self._meta_cache.pop(metadata_file, None)
+        self._update_index(add={safe_name: metadata})
 
         unreal.log(f"Created show '{show_name}' at: {show_path}")
         return show_path, metadata
 
     def import_panels_to_show(self, show_name, source_files):
         """Import panels to the show's panels folder"""
-        show_path = self.shows_root / show_name
-        panels_path = show_path / "Panels"
+        panels_path = os.path.join(self._shows_root_str, show_name, "Panels")
 
-        if not panels_path.exists():
+        # Count existing entries once; each import takes the next index
+        try:
+            with os.scandir(panels_path) as entries:
+                existing_count = sum(1 for _ in entries)
+        except (FileNotFoundError, NotADirectoryError):
             unreal.log_error(f"Show '{show_name}' panels folder not found")
             return []
 
-        imported_files = []
+        # Name every copy up front so they can run in parallel and keep their order
+        jobs = []
         for source_file in source_files:
-            source = Path(source_file)
-            if source.exists():
-                # Copy to panels folder with organized naming
-                existing_count = len(list(panels_path.glob('*')))
-                dest_name = f"{existing_count:03d}_{source.name}"
-                dest_path = panels_path / dest_name
-                shutil.copy2(source, dest_path)
-                imported_files.append(str(dest_path))
-                unreal.log(f"Imported panel: {dest_name}")
+            if os.path.isfile(source_file):
+                dest_name = f"{existing_count + len(jobs):03d}_{os.path.basename(source_file)}"
+                jobs.append((source_file, os.path.join(panels_path, dest_name)))
+
+        imported_files = []
+        if jobs:
+            # Copies release the GIL, so a few threads overlap their I/O
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4, len(jobs))) as pool:
+                futures = [pool.submit(shutil.copy2, source, dest_path) for source, dest_path in jobs]
+
+            for (source, dest_path), future in zip(jobs, futures):
+                try:
+                    future.result()
+                except FileNotFoundError:
+                    continue
+                except OSError as e:
+                    error = e
+                    if _is_busy_share_error(e):
+                        # Some network shares reject concurrent copies; retry serially
+                        try:
+                            shutil.copy2(source, dest_path)
+                            error = None
+                        except OSError as retry_error:
+                            error = retry_error
+
+                    if error is not None:
+                        # Skip this panel but keep going, so the panels that did
+                        # copy still reach the show metadata
+                        unreal.log_error(f"Failed to import panel {os.path.basename(source)}: {error}")
+                        try:
+                            os.remove(dest_path)  # drop a partial copy
+                        except OSError:
+                            pass
+                        continue
+                imported_files.append(dest_path)
+                unreal.log(f"Imported panel: {os.path.basename(dest_path)}")
 
         # Update show metadata
         self.update_show_metadata(show_name, imported_files)
@@ -83,83 +202,162 @@ class ShowsManager:
         return imported_files
 
     def update_show_metadata(self, show_name, new_panels):
-        """Update show metadata with new panels"""
+        """Update show metadata with new panels (one read, one atomic write)"""
         show_path = self.shows_root / show_name
         metadata_file = show_path / "show_metadata.json"
 
-        if metadata_file.exists():
-            with open(metadata_file, 'r') as f:
-                metadata = json.load(f)
+        metadata = self._read_metadata(metadata_file)
+        if metadata is None:
+            return
 
-            metadata['modified'] = datetime.now().isoformat()
-            metadata['panels'].extend([str(Path(p).name) for p in new_panels])
+        metadata['modified'] = datetime.now().isoformat()
+        metadata['panels'].extend(os.path.basename(p) for p in new_panels)
 
-            with open(metadata_file, 'w') as f:
-                json.dump(metadata, f, indent=2)
+        try:
+            _atomic_write_json(metadata_file, metadata, compact=True)
+        finally:
+            self._meta_cache.pop(metadata_file, None)
+        self._update_index(add={show_name: metadata})
+
+    def _read_metadata(self, metadata_file):
+        """Read a show_metadata.json, re-parsing only if its stat changed; returns a private copy"""
+        try:
+            stat = metadata_file.stat()
+        except FileNotFoundError:
+            self._meta_cache.pop(metadata_file, None)
+            return None
+
+        cached = self._meta_cache.get(metadata_file)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return copy.deepcopy(cached[2])
+
+        metadata = load_json(metadata_file.read_bytes())
+        self._meta_cache[metadata_file] = (stat.st_mtime_ns, stat.st_size, metadata)
+        return copy.deepcopy(metadata)
 
     def get_all_shows(self):
-        """Get list of all shows"""
-        shows = []
-        if self.shows_root.exists():
-            for show_dir in self.shows_root.iterdir():
-                if show_dir.is_dir():
-                    metadata_file = show_dir / "show_metadata.json"
-                    if metadata_file.exists():
-                        with open(metadata_file, 'r') as f:
-                            metadata = json.load(f)
-                            shows.append(metadata)
-        return shows
+        """Get list of all shows (index entries: safe_name, name, created, modified)"""
+        index = self._read_index() or self.rebuild_index()
+        return list(index['shows'].values())
+
+    def _read_index(self):
+        """Load the shows index, or None if it is missing or no longer matches the folders"""
+        try:
+            index = load_json(self.index_file.read_bytes())
+            with os.scandir(self.shows_root) as entries:
+                show_dirs = {entry.name for entry in entries if entry.is_dir(follow_symlinks=False)}
+        except (OSError, ValueError):
+            return None
+
+        # Folders added or removed behind our back (e.g. copied in by hand)
+        if not isinstance(index, dict) or set(index.get('dirs', ())) != show_dirs:
+            return None
+        return index
+
+    def rebuild_index(self):
+        """Rebuild the shows index by reading every show's metadata once"""
+        with self._index_lock:
+            show_dirs = []
+            shows = {}
+            try:
+                # scandir's DirEntry answers is_dir() from the listing, without a stat per entry
+                with os.scandir(self.shows_root) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            show_dirs.append(entry.name)
+                            metadata = self._read_metadata(Path(entry.path, "show_metadata.json"))
+                            if metadata is not None:
+                                shows[entry.name] = {key: metadata.get(key) for key in _INDEX_FIELDS}
+            except FileNotFoundError:
+                pass
+
+            index = {'dirs': sorted(show_dirs), 'shows': shows}
+            self._write_index(index)
+            return index
+
+    def _update_index(self, add=None, remove=()):
+        """Apply show changes to the index; add maps folder name -> metadata (or None)"""
+        with self._index_lock:
+            try:
+                index = load_json(self.index_file.read_bytes())
+                show_dirs = set(index['dirs'])
+                shows = index['shows']
+            except (OSError, ValueError, KeyError, TypeError):
+                self.rebuild_index()
+                return
+
+            for name in remove:
+                show_dirs.discard(name)
+                shows.pop(name, None)
+            for name, metadata in (add or {}).items():
+                show_dirs.add(name)
+                if metadata is not None:
+                    shows[name] = {key: metadata.get(key) for key in _INDEX_FIELDS}
+
+            index['dirs'] = sorted(show_dirs)
+            self._write_index(index)
+
+    def _write_index(self, index):
+        """Write the shows index atomically"""
+        try:
+            _atomic_write_json(self.index_file, index, compact=True)
+        except OSError as e:
+            unreal.log_warning(f"Failed to write shows index: {e}")
 
     def load_show(self, show_name):
         """Load a show's data"""
         show_path = self.shows_root / show_name
-        metadata_file = show_path / "show_metadata.json"
-
-        if metadata_file.exists():
-            with open(metadata_file, 'r') as f:
-                return json.load(f)
-        return None
+        return self._read_metadata(show_path / "show_metadata.json")
 
     def delete_show(self, show_name):
         """Delete a show and all its contents"""
         show_path = self.shows_root / show_name
         if show_path.exists():
             shutil.rmtree(show_path)
+            self._meta_cache.pop(show_path / "show_metadata.json", None)
+            self._update_index(remove=(show_name,))
             unreal.log(f"Deleted show: {show_name}")
             return True
         return False
 
-    def rename_show(self, old_name, new_name):
-        """Rename a show"""
+    def rename_show(self, old_name, new_name, *, metadata=None):
+        """Rename a show; pass metadata (e.g. from load_show) to skip reading it again"""
         old_path = self.shows_root / old_name
-        safe_new_name = "".join(c for c in new_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
-        safe_new_name = safe_new_name.replace(' ', '_')
+        safe_new_name = _safe_show_name(new_name)
         new_path = self.shows_root / safe_new_name
 
         if old_path.exists() and not new_path.exists():
+            # Read before the move so an already cached parse is reused
+            old_metadata_file = old_path / "show_metadata.json"
+            if metadata is None:
+                metadata = self._read_metadata(old_metadata_file)
+
             old_path.rename(new_path)
+            self._meta_cache.pop(old_metadata_file, None)
 
-            # Update metadata
+            # Update metadata (a copy, so the caller's dict is left alone)
             metadata_file = new_path / "show_metadata.json"
-            if metadata_file.exists():
-                with open(metadata_file, 'r') as f:
-                    metadata = json.load(f)
-
+            if metadata is not None:
+                metadata = dict(metadata)
                 metadata['name'] = new_name
                 metadata['safe_name'] = safe_new_name
                 metadata['modified'] = datetime.now().isoformat()
 
-                with open(metadata_file, 'w') as f:
-                    json.dump(metadata, f, indent=2)
+                _atomic_write_json(metadata_file, metadata)
+                self._meta_cache.pop(metadata_file, None)
+            self._update_index(add={safe_new_name: metadata}, remove=(old_name,))
 
             unreal.log(f"Renamed show from '{old_name}' to '{new_name}'")
             return True
         return False
 
-    def duplicate_show(self, show_name):
-        """Duplicate a show with all its contents"""
+    def duplicate_show(self, show_name, *, metadata=None):
+        """Duplicate a show with all its contents; pass metadata to skip reading it again"""
         source_path = self.shows_root / show_name
         if source_path.exists():
+            if metadata is None:
+                metadata = self._read_metadata(source_path / "show_metadata.json")
+
             # Find unique name for copy
             copy_num = 1
             while True:
@@ -169,23 +367,42 @@ class ShowsManager:
                     break
                 copy_num += 1
 
-            # Copy entire directory
-            shutil.copytree(source_path, new_path)
+            # Copy entire directory, cloning file extents where the filesystem can;
+            # otherwise copy, not copy2: a duplicate is a new show, so per-file
+            # timestamps are not worth a copystat each
+            if not self._clone_show_tree(source_path, new_path):
+                shutil.copytree(source_path, new_path, copy_function=shutil.copy)
 
-            # Update metadata
+            # Update metadata (a copy, so a dict passed in by the caller is left alone)
             metadata_file = new_path / "show_metadata.json"
-            if metadata_file.exists():
-                with open(metadata_file, 'r') as f:
-                    metadata = json.load(f)
-
+            if metadata is not None:
+                metadata = dict(metadata)
                 metadata['name'] = f"{metadata['name']} Copy {copy_num}"
                 metadata['safe_name'] = new_name
-                metadata['created'] = datetime.now().isoformat()
-                metadata['modified'] = datetime.now().isoformat()
+                now = datetime.now().isoformat()
+                metadata['created'] = now
+                metadata['modified'] = now
 
-                with open(metadata_file, 'w') as f:
-                    json.dump(metadata, f, indent=2)
+                _atomic_write_json(metadata_file, metadata)
+                self._meta_cache.pop(metadata_file, None)
+            self._update_index(add={new_name: metadata})
 
             unreal.log(f"Duplicated show '{show_name}' to '{new_name}'")
             return new_path
         return None
+
+    def _clone_show_tree(self, source_path, new_path):
+        """Copy a show folder copy-on-write; False if unavailable or it failed"""
+        cls = type(self)
+        if cls._clone_tree is None:
+            cls._clone_tree = _find_clone_tree() or False
+        if not cls._clone_tree:
+            return False
+
+        try:
+            cls._clone_tree(source_path, new_path)
+            return True
+        except (OSError, subprocess.SubprocessError) as e:
+            unreal.log_warning(f"Copy-on-write duplicate failed, copying instead: {e}")
+            shutil.rmtree(new_path, ignore_errors=True)
+            return False
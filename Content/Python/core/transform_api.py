@@ -12,6 +12,7 @@ API COMPATIBILITY:
 """
 
 import unreal
+import traceback
 
 
 # Detect which TimeUnit enum is available
@@ -120,7 +121,6 @@ def apply_transform_to_spawnable(sequence, spawnable_binding, location_delta, ro
 
     except Exception as e:
         unreal.log_error(f"Failed to apply transform: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -298,7 +298,6 @@ def test_transform_api():
 
     except Exception as e:
         unreal.log_error(f"Test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
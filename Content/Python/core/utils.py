@@ -6,7 +6,37 @@ Shared utilities to prevent code duplication
 """
 
 import unreal
+import json
 from pathlib import Path
+from typing import Any
+
+# orjson serializes several times faster; fall back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# Stdlib encoders are built once instead of per json.dumps call
+_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False, separators=(',', ': ')).encode
+_COMPACT_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+
+def dump_json(obj: Any, compact: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON in one call; indented unless compact"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    encode = _COMPACT_ENCODER if compact else _ENCODER
+    return encode(obj).encode('utf-8')
+
+def load_json(data: bytes) -> Any:
+    """Parse JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
 
 # Singleton instances
 _managers = {}